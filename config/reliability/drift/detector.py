@@ -2,28 +2,105 @@
 
 - Embedding cosine distance threshold
 - Probability distribution KL divergence
+
+If ``simsimd`` is installed, single-pair cosine distance uses its fused
+SIMD kernel (AVX2/AVX-512/NEON); otherwise NumPy is used.
+
+``CosineDriftDetector`` tracks the p95 cosine distance of a stream of pairs
+in constant memory with a DDSketch (requires ``ddsketch``).
 """
 
+import math
 from typing import List
 
 import numpy as np
 
+try:
+    import simsimd
+except ImportError:  # optional accelerator
+    simsimd = None
+
+try:
+    from ddsketch import DDSketch
+except ImportError:  # optional, only needed for CosineDriftDetector
+    DDSketch = None
+
+_SIMD_DTYPES = frozenset(np.dtype(t) for t in (np.float16, np.float32, np.float64))
+
+
+def _simd_compatible(a: np.ndarray, b: np.ndarray) -> bool:
+    return (
+        a.dtype == b.dtype
+        and a.dtype in _SIMD_DTYPES
+        and a.ndim == 1
+        and b.ndim == 1
+        and a.shape == b.shape
+        and a.flags.c_contiguous
+        and b.flags.c_contiguous
+    )
+
 
 def cosine_distance(a: np.ndarray, b: np.ndarray) -> float:
-    a_n = a / (np.linalg.norm(a) + 1e-9)
-    b_n = b / (np.linalg.norm(b) + 1e-9)
-    return 1.0 - float(np.dot(a_n, b_n))
+    if simsimd is not None and _simd_compatible(a, b):
+        d = float(simsimd.cosine(a, b))
+        # simsimd reports 0.0 for two zero vectors; only then is the extra
+        # pass needed to tell that apart from identical directions
+        if math.isfinite(d) and not (d == 0.0 and not a.any()):
+            return d
+    # A zero vector has no direction: maximal distance, as in is_drifted_cosine
+    norm = float(np.linalg.norm(a)) * float(np.linalg.norm(b))
+    if norm == 0.0:
+        return 1.0
+    return 1.0 - float(np.dot(a, b)) / norm
 
 
 def kl_divergence(p: np.ndarray, q: np.ndarray) -> float:
     eps = 1e-9
-    p = np.clip(p, eps, 1)
-    q = np.clip(q, eps, 1)
-    return float(np.sum(p * (np.log(p) - np.log(q))))
+    # Float inputs are used as-is (no float32 -> float64 copy); only
+    # integer counts are upcast
+    p = np.asarray(p)
+    q = np.asarray(q)
+    if not np.issubdtype(p.dtype, np.floating):
+        p = p.astype(np.float64)
+    if not np.issubdtype(q.dtype, np.floating):
+        q = q.astype(np.float64)
+    # Terms with p ~ 0 contribute nothing; mask them out rather than
+    # clipping full copies of both distributions.
+    m = p > eps
+    p_m = p[m]
+    return float(np.dot(p_m, np.log(p_m / np.maximum(q[m], eps))))
 
 
 def is_drifted_cosine(
     ref: List[np.ndarray], cur: List[np.ndarray], threshold: float = 0.15
 ) -> bool:
-    dists = [cosine_distance(r, c) for r, c in zip(ref, cur)]
+    # Row-wise cosine distance over the stacked pairs in one pass
+    n = min(len(ref), len(cur))
+    R = np.asarray(ref[:n])
+    C = np.asarray(cur[:n])
+    Rn = R / (np.linalg.norm(R, axis=1, keepdims=True) + 1e-9)
+    Cn = C / (np.linalg.norm(C, axis=1, keepdims=True) + 1e-9)
+    dists = 1.0 - np.einsum("ij,ij->i", Rn, Cn)
     return float(np.percentile(dists, 95)) > threshold
+
+
+class CosineDriftDetector:
+    """Streaming cosine drift check backed by a DDSketch quantile sketch."""
+
+    def __init__(self, relative_accuracy: float = 0.01, quantile: float = 0.95):
+        if DDSketch is None:
+            raise ImportError("CosineDriftDetector requires the 'ddsketch' package")
+        self.quantile = quantile
+        self._sketch = DDSketch(relative_accuracy=relative_accuracy)
+
+    @property
+    def count(self) -> int:
+        return int(self._sketch.count)
+
+    def update(self, r: np.ndarray, c: np.ndarray) -> None:
+        self._sketch.add(cosine_distance(r, c))
+
+    def is_drifted(self, threshold: float = 0.15) -> bool:
+        if self._sketch.count == 0:
+            return False
+        return float(self._sketch.get_quantile_value(self.quantile)) > threshold
@@ -1,21 +1,32 @@
+import asyncio
+import gzip
 import hashlib
 import logging
 import os
 import random
 import sys
 import time
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Deque, Dict, Mapping, Optional, Tuple
 
 import httpx
+import orjson
+import xxhash
 from fastapi import FastAPI, HTTPException, Request, Response
-from prometheus_client import (CONTENT_TYPE_LATEST, Counter, Histogram,
-                               generate_latest)
+from fastapi.responses import ORJSONResponse
+from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry, Counter,
+                               Histogram, ProcessCollector, generate_latest)
 from pydantic import BaseModel, Field
 
 from shared.observability import (
     setup_logging, setup_tracing, instrument_fastapi, instrument_httpx,
-    trace_operation, add_span_attributes, get_correlation_id, sanitize_for_json_logging
+    trace_operation, add_span_attributes, get_correlation_id, sanitize_for_json_logging,
+    is_span_recording
 )
 
 # Initialize observability
@@ -26,7 +37,7 @@ logger = setup_logging(SERVICE_NAME)
 tracer = setup_tracing(SERVICE_NAME, SERVICE_VERSION)
 
 # Configure uvicorn loggers to use our JSON formatter
-def configure_uvicorn_logging():
+def configure_uvicorn_logging() -> None:
     """Configure uvicorn's access and error loggers to use JSON format."""
     # Get our JSON formatter
     json_handler = logging.root.handlers[0] if logging.root.handlers else None
@@ -51,10 +62,42 @@ def configure_uvicorn_logging():
 
 configure_uvicorn_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own a pooled TorchServe client for the lifetime of the process."""
+    app.state.cfg = GatewayConfig.from_env()
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=200, max_keepalive_connections=50, keepalive_expiry=30
+        ),
+        http2=True,
+        timeout=httpx.Timeout(3.0),
+    )
+    # Routing RNG owned by this process instead of the module-global one
+    app.state.rng = random.Random()
+    # /predict_async jobs, their in-flight tasks, and (finished_at, job_id)
+    # in completion order for TTL expiry
+    app.state.jobs = {}
+    app.state.job_tasks = set()
+    app.state.finished_jobs = deque()
+    try:
+        yield
+    finally:
+        # Let cancelled jobs unwind before their client goes away
+        job_tasks = list(app.state.job_tasks)
+        for task in job_tasks:
+            task.cancel()
+        await asyncio.gather(*job_tasks, return_exceptions=True)
+        await app.state.http.aclose()
+
+
 app = FastAPI(
     title="Seraphim Inference API",
     version="0.1.0",
     description="Gateway service with canary routing for ML model inference",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Instrument FastAPI and HTTP clients
@@ -67,6 +110,10 @@ class ModelVariant(str, Enum):
     CANDIDATE = "candidate"
 
 
+BASELINE, CANDIDATE = ModelVariant.BASELINE, ModelVariant.CANDIDATE
+BASELINE_STR, CANDIDATE_STR = BASELINE.value, CANDIDATE.value
+
+
 class PredictRequest(BaseModel):
     text: str = Field(
         ..., min_length=1, max_length=10000, description="Text to predict"
@@ -85,26 +132,76 @@ class PredictResponse(BaseModel):
     )
 
 
+class PredictJobResponse(BaseModel):
+    job_id: str = Field(..., description="Handle for polling /predict_result")
+    status: str = Field(..., description="pending, done or failed")
+    result: Optional[PredictResponse] = Field(
+        None, description="Prediction once the job is done"
+    )
+
+
+@dataclass(slots=True)
+class PredictJob:
+    """In-memory state of one /predict_async request."""
+
+    job_id: str
+    status: str = "pending"
+    result: Optional[Dict[str, Any]] = None
+    finished_at: Optional[float] = None
+
+
 MODEL_VERSION = "v0"
 
+# Latency buckets sized for the gateway's real range (~5ms to a few seconds)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _parse_buckets(
+    val: Optional[str], default: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+) -> Tuple[float, ...]:
+    if not val:
+        return default
+    try:
+        buckets = tuple(sorted(float(b) for b in val.split(",") if b.strip()))
+        return buckets or default
+    except ValueError:
+        return default
+
+
 # Prometheus metrics
+# Dedicated registry: gateway metrics plus process_* (used by alerting rules),
+# without the default platform/GC collectors
+REGISTRY = CollectorRegistry()
+ProcessCollector(registry=REGISTRY)
+
 REQUEST_COUNT = Counter(
     "seraphim_inference_requests_total",
     "Total number of inference requests",
     labelnames=["variant", "outcome"],
+    registry=REGISTRY,
 )
 LATENCY_HIST = Histogram(
     "seraphim_inference_latency_seconds",
     "Inference latency in seconds",
     labelnames=["variant"],
+    buckets=_parse_buckets(os.environ.get("INFER_LATENCY_BUCKETS")),
+    registry=REGISTRY,
 )
 
+# Only gzip /metrics payloads larger than this
+METRICS_GZIP_MIN_BYTES = 1024
 
-def _env_bool(name: str, default: bool = False) -> bool:
-    val = os.environ.get(name)
-    if val is None:
-        return default
-    return str(val).lower() in {"1", "true", "yes", "on"}
+# Pre-bound label children so the hot path skips prometheus_client's lookup
+OUTCOMES = ("success", "timeout", "http_error", "error")
+OUTCOME_COUNTERS = {
+    (variant, outcome): REQUEST_COUNT.labels(variant=variant, outcome=outcome)
+    for variant in (BASELINE_STR, CANDIDATE_STR)
+    for outcome in OUTCOMES
+}
+LATENCY_BY_VARIANT = {
+    variant: LATENCY_HIST.labels(variant=variant)
+    for variant in (BASELINE_STR, CANDIDATE_STR)
+}
 
 
 def _parse_percent(val: Optional[str], default: float = 0.0) -> float:
@@ -118,28 +215,166 @@ def _parse_percent(val: Optional[str], default: float = 0.0) -> float:
         return default
 
 
+def _model_url(ts_url: str, model_name: str, model_version: str) -> str:
+    if model_version:
+        return f"{ts_url}/predictions/{model_name}/{model_version}"
+    return f"{ts_url}/predictions/{model_name}"
+
+
+# Sticky-routing hash functions; sha256 reproduces the original bucketing
+STICKY_HASHES = ("xxh3", "blake2b", "sha256")
+
+
+@dataclass(frozen=True, slots=True)
+class GatewayConfig:
+    """Routing and upstream settings resolved once from the environment."""
+
+    ts_url_default: str = "http://localhost:8080"
+    ts_url_candidate: str = "http://localhost:8080"
+    model_name_baseline: str = "custom-text"
+    model_version_baseline: str = ""
+    model_name_candidate: str = "custom-text"
+    model_version_candidate: str = ""
+    canary_percent: float = 0.0
+    sticky_header: str = "X-User-Id"
+    salt: str = "seraphim"
+    timeout_s: float = 3.0
+    force_header: str = "X-Canary"
+    sticky_hash: str = "xxh3"
+    job_ttl_s: float = 300.0
+    max_async_jobs: int = 1000
+
+    # Derived from the fields above in __post_init__
+    url_baseline: str = field(init=False)
+    url_candidate: str = field(init=False)
+    salt_bytes: bytes = field(init=False)
+    threshold: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.sticky_hash not in STICKY_HASHES:
+            raise ValueError(
+                f"Unknown sticky hash {self.sticky_hash!r}; expected one of "
+                f"{', '.join(STICKY_HASHES)}"
+            )
+        salt_bytes = self.salt.encode("utf-8")
+        if (
+            self.sticky_hash == "blake2b"
+            and len(salt_bytes) > hashlib.blake2b.MAX_KEY_SIZE
+        ):
+            salt_bytes = hashlib.blake2b(salt_bytes).digest()
+
+        object.__setattr__(
+            self,
+            "url_baseline",
+            _model_url(
+                self.ts_url_default,
+                self.model_name_baseline,
+                self.model_version_baseline,
+            ),
+        )
+        object.__setattr__(
+            self,
+            "url_candidate",
+            _model_url(
+                self.ts_url_candidate,
+                self.model_name_candidate,
+                self.model_version_candidate,
+            ),
+        )
+        object.__setattr__(self, "salt_bytes", salt_bytes)
+        object.__setattr__(self, "threshold", int(self.canary_percent * 10000))
+
+    @classmethod
+    def from_env(cls) -> "GatewayConfig":
+        ts_url_default = os.environ.get("TS_URL", "http://localhost:8080")
+        model_name_baseline = os.environ.get(
+            "MODEL_NAME_BASELINE", os.environ.get("MODEL_NAME", "custom-text")
+        )
+
+        return cls(
+            ts_url_default=ts_url_default,
+            ts_url_candidate=os.environ.get("TS_URL_CANDIDATE", ts_url_default),
+            model_name_baseline=model_name_baseline,
+            model_version_baseline=os.environ.get("MODEL_VERSION_BASELINE", ""),
+            model_name_candidate=os.environ.get(
+                "MODEL_NAME_CANDIDATE", model_name_baseline
+            ),
+            model_version_candidate=os.environ.get("MODEL_VERSION_CANDIDATE", ""),
+            canary_percent=_parse_percent(os.environ.get("CANARY_PERCENT", "0"), 0.0),
+            sticky_header=os.environ.get("CANARY_STICKY_HEADER", "X-User-Id"),
+            salt=os.environ.get("CANARY_STICKY_SALT", "seraphim"),
+            timeout_s=float(os.environ.get("TS_TIMEOUT_MS", "3000")) / 1000.0,
+            force_header=os.environ.get("CANARY_FORCE_HEADER", "X-Canary"),
+            sticky_hash=os.environ.get("CANARY_HASH", "xxh3").lower(),
+            job_ttl_s=float(os.environ.get("ASYNC_JOB_TTL_S", "300")),
+            max_async_jobs=int(os.environ.get("ASYNC_MAX_INFLIGHT", "1000")),
+        )
+
+
+@lru_cache(maxsize=65536)
+def _sticky_bucket(algo: str, salt_bytes: bytes, key: str) -> int:
+    """Map a sticky key to a bucket in 0..9999 (cached per hash, salt and key)."""
+    key_bytes = key.encode("utf-8")
+    if algo == "xxh3":
+        seed = xxhash.xxh3_64_intdigest(salt_bytes)
+        return xxhash.xxh3_64_intdigest(key_bytes, seed=seed) % 10000
+    if algo == "blake2b":
+        h = hashlib.blake2b(key_bytes, digest_size=2, key=salt_bytes).digest()
+    else:
+        h = hashlib.sha256(salt_bytes + b":" + key_bytes).digest()[:2]
+    return int.from_bytes(h, "big") % 10000
+
+
+# Dummy prediction returned when the upstream call fails (same rule as the
+# sample TorchServe handler): even length -> positive, odd -> negative
+_PARITY = ("positive", "negative")
+
+
+def _fallback(text: str) -> str:
+    return _PARITY[len(text) & 1]
+
+
+# Shared upstream headers; httpx copies them into each request
+_TEXT_PLAIN_HEADERS = {"Content-Type": "text/plain"}
+
+# Accepted override header values -> forced variant
+_FORCE_VARIANT = {
+    "candidate": CANDIDATE,
+    "canary": CANDIDATE,
+    "v2": CANDIDATE,
+    "baseline": BASELINE,
+    "control": BASELINE,
+    "v1": BASELINE,
+}
+
+
 def _choose_variant(
-    request: Request, canary_percent: float, sticky_header: str, salt: str
-) -> str:
+    headers: Mapping[str, str],
+    cfg: GatewayConfig,
+    rng: Optional[random.Random] = None,
+) -> ModelVariant:
     # Explicit override header if present
-    force = request.headers.get(os.environ.get("CANARY_FORCE_HEADER", "X-Canary"))
+    force = headers.get(cfg.force_header)
     if force:
-        force_l = force.lower()
-        if force_l in {"candidate", "canary", "v2"}:
-            return "candidate"
-        if force_l in {"baseline", "control", "v1"}:
-            return "baseline"
+        forced = _FORCE_VARIANT.get(force.lower())
+        if forced is not None:
+            return forced
+
+    # Canary fully off/on: no need to hash or sample
+    if cfg.canary_percent <= 0.0:
+        return BASELINE
+    if cfg.canary_percent >= 1.0:
+        return CANDIDATE
 
     # Sticky routing based on a header (e.g., user id)
-    key = request.headers.get(sticky_header)
+    key = headers.get(cfg.sticky_header)
     if key:
-        h = hashlib.sha256((salt + ":" + key).encode("utf-8")).digest()
-        bucket = int.from_bytes(h[:2], "big") % 10000  # 0..9999
-        threshold = int(canary_percent * 10000)
-        return "candidate" if bucket < threshold else "baseline"
+        bucket = _sticky_bucket(cfg.sticky_hash, cfg.salt_bytes, key)
+        return CANDIDATE if bucket < cfg.threshold else BASELINE
 
     # Fallback to random sampling
-    return "candidate" if random.random() < canary_percent else "baseline"
+    draw = rng.random() if rng is not None else random.random()
+    return CANDIDATE if draw < cfg.canary_percent else BASELINE
 
 
 @app.get("/healthz", tags=["health"])
@@ -149,22 +384,28 @@ def health() -> Dict[str, Any]:
 
 
 @app.get("/metrics", tags=["metrics"])
-def metrics() -> Response:
-    payload = generate_latest()
-    return Response(content=payload, media_type=CONTENT_TYPE_LATEST)
+def metrics(request: Request) -> Response:
+    payload = generate_latest(REGISTRY)
+    headers = {}
+    if (
+        len(payload) > METRICS_GZIP_MIN_BYTES
+        and "gzip" in request.headers.get("accept-encoding", "")
+    ):
+        payload = gzip.compress(payload, compresslevel=1, mtime=0)
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=payload, media_type=CONTENT_TYPE_LATEST, headers=headers)
 
 
 @app.get("/readyz", tags=["health"])
-async def ready() -> Dict[str, Any]:
+async def ready(request: Request) -> Dict[str, Any]:
     """Readiness check - verify TorchServe connectivity."""
-    ts_url = os.environ.get("TS_URL", "http://localhost:8080")
+    ts_url = request.app.state.cfg.ts_url_default
     try:
-        async with httpx.AsyncClient(timeout=2.0) as client:
-            response = await client.get(f"{ts_url}/ping")
-            response.raise_for_status()
-            return {"ready": True, "torchserve": "healthy"}
+        response = await request.app.state.http.get(f"{ts_url}/ping", timeout=2.0)
+        response.raise_for_status()
+        return {"ready": True, "torchserve": "healthy"}
     except Exception as e:
-        logger.warning(f"TorchServe health check failed: {e}")
+        logger.warning("TorchServe health check failed: %s", e)
         raise HTTPException(status_code=503, detail="TorchServe not ready")
 
 
@@ -203,6 +444,7 @@ def observability_config() -> Dict[str, Any]:
             "handlers": [type(h).__name__ for h in logging.root.handlers],
         },
         "tracing": {
+            "jaeger_legacy": os.environ.get("JAEGER_LEGACY", "false"),
             "jaeger_agent_host": os.environ.get("JAEGER_AGENT_HOST", "not_set"),
             "jaeger_agent_port": os.environ.get("JAEGER_AGENT_PORT", "not_set"),
             "otlp_endpoint": os.environ.get("OTLP_ENDPOINT", "not_set"),
@@ -266,134 +508,89 @@ def get_trace_info(correlation_id: str) -> Dict[str, Any]:
         }
 
 
-@app.post("/predict", response_model=PredictResponse, tags=["inference"])
-async def predict(req: PredictRequest, request: Request) -> PredictResponse:
-    """Main prediction endpoint with canary routing."""
-    correlation_id = get_correlation_id()
+async def _run_prediction(
+    req: PredictRequest,
+    state: Any,
+    headers: Mapping[str, str],
+    correlation_id: Optional[str],
+) -> Dict[str, Any]:
+    """Route, call TorchServe (with fallback) and return the response fields.
+
+    Takes the app state and the request's headers rather than the Request
+    itself, so /predict_async jobs can run after their response is sent.
+    """
+    log_info = logger.isEnabledFor(logging.INFO)
     
     # Add span attributes for request context
-    add_span_attributes(
-        text_length=len(req.text),
-        correlation_id=correlation_id or "none"
-    )
-    
-    logger.info(
-        "Processing prediction request", 
-        extra={
-            "text_length": len(req.text),
-            "correlation_id": correlation_id
-        }
-    )
-    
-    start = time.time()
-
-    with trace_operation("canary_routing") as routing_span:
-        # Configuration
-        ts_url_default = os.environ.get("TS_URL", "http://localhost:8080")
-        ts_url_candidate = os.environ.get("TS_URL_CANDIDATE", ts_url_default)
-
-        # Baseline model config
-        model_name_baseline = os.environ.get(
-            "MODEL_NAME_BASELINE", os.environ.get("MODEL_NAME", "custom-text")
-        )
-        model_version_baseline = os.environ.get("MODEL_VERSION_BASELINE", "")
-
-        # Candidate model config
-        model_name_candidate = os.environ.get("MODEL_NAME_CANDIDATE", model_name_baseline)
-        model_version_candidate = os.environ.get("MODEL_VERSION_CANDIDATE", "")
-
-        # Canary routing
-        canary_percent = _parse_percent(os.environ.get("CANARY_PERCENT", "0"), 0.0)
-        sticky_header = os.environ.get("CANARY_STICKY_HEADER", "X-User-Id")
-        salt = os.environ.get("CANARY_STICKY_SALT", "seraphim")
-
-        variant = _choose_variant(request, canary_percent, sticky_header, salt)
-        
-        # Add routing attributes to span
-        routing_span.set_attribute("canary.variant", variant)
-        routing_span.set_attribute("canary.percent", str(canary_percent))
-
-        # Resolve target
-        if variant == "candidate":
-            target_ts = ts_url_candidate
-            target_name = model_name_candidate
-            target_ver = model_version_candidate
-            used_variant = ModelVariant.CANDIDATE
-        else:
-            target_ts = ts_url_default
-            target_name = model_name_baseline
-            target_ver = model_version_baseline
-            used_variant = ModelVariant.BASELINE
-
-        # Build TorchServe URL
-        if target_ver:
-            url = f"{target_ts}/predictions/{target_name}/{target_ver}"
-        else:
-            url = f"{target_ts}/predictions/{target_name}"
-            
-        # Add model attributes to span
-        routing_span.set_attribute("model.variant", used_variant.value)
-        routing_span.set_attribute("model.name", target_name)
-        routing_span.set_attribute("model.version", target_ver or "default")
-        routing_span.set_attribute("torchserve.url", url)
-
-        logger.info(
-            "Routing decision made",
-            extra={
-                "variant": used_variant.value,
-                "model_name": target_name,
-                "model_version": target_ver or "default",
-                "url": url,
-                "canary_percent": canary_percent,
-                "correlation_id": correlation_id
-            }
+    if is_span_recording():
+        add_span_attributes(
+            text_length=len(req.text),
+            correlation_id=correlation_id or "none"
         )
+    
+    start_ns = time.perf_counter_ns()
+
+    cfg: GatewayConfig = state.cfg
+
+    canary_percent = cfg.canary_percent
+    used_variant = _choose_variant(headers, cfg, state.rng)
+    variant = used_variant.value
+
+    # Resolve target
+    if used_variant is CANDIDATE:
+        target_name = cfg.model_name_candidate
+        target_ver = cfg.model_version_candidate
+        url = cfg.url_candidate
+    else:
+        target_name = cfg.model_name_baseline
+        target_ver = cfg.model_version_baseline
+        url = cfg.url_baseline
+
+    # Routing is a few lookups; record it on the request span, not its own span
+    if is_span_recording():
+        add_span_attributes(**{
+            "canary.variant": variant,
+            "canary.percent": canary_percent,
+            "model.variant": variant,
+            "model.name": target_name,
+            "model.version": target_ver or "default",
+            "torchserve.url": url,
+        })
 
     with trace_operation("model_inference", 
                         model_name=target_name,
                         model_version=target_ver or "default",
-                        variant=used_variant.value) as inference_span:
+                        variant=variant) as inference_span:
         try:
-            headers = {"Content-Type": "text/plain"}
-            timeout_ms = float(os.environ.get("TS_TIMEOUT_MS", "3000"))
+            timeout_ms = cfg.timeout_s * 1000.0
             
             # Add inference attributes to span
             inference_span.set_attribute("inference.timeout_ms", str(timeout_ms))
             inference_span.set_attribute("inference.url", url)
 
-            async with httpx.AsyncClient(timeout=timeout_ms / 1000.0) as client:
-                response = await client.post(
-                    url, content=req.text.encode("utf-8"), headers=headers
-                )
-                response.raise_for_status()
-                
-                # Add response attributes to span
-                inference_span.set_attribute("http.response.status_code", response.status_code)
-                inference_span.set_attribute("http.response.content_type", 
-                                           response.headers.get("content-type", "unknown"))
-
-                content_type = response.headers.get("content-type", "")
-                if content_type.startswith("application/json"):
-                    data = response.json()
-                    pred = data.get("prediction", data.get("result", "unknown"))
-                else:
-                    pred = response.text.strip()
-                
-                inference_span.set_attribute("inference.prediction", pred)
-                inference_span.set_attribute("inference.outcome", "success")
-
-                logger.info(
-                    "Model inference completed successfully",
-                    extra={
-                        "variant": used_variant.value,
-                        "model_name": target_name,
-                        "model_version": target_ver or "default",
-                        "prediction": sanitize_for_json_logging(pred),
-                        "response_time_ms": (time.time() - start) * 1000,
-                        "correlation_id": correlation_id
-                    }
-                )
-                REQUEST_COUNT.labels(variant=used_variant.value, outcome="success").inc()
+            response = await state.http.post(
+                url,
+                content=req.text.encode("utf-8"),
+                headers=_TEXT_PLAIN_HEADERS,
+                timeout=cfg.timeout_s,
+            )
+            response.raise_for_status()
+            
+            # Add response attributes to span
+            inference_span.set_attribute("http.response.status_code", response.status_code)
+            inference_span.set_attribute("http.response.content_type", 
+                                       response.headers.get("content-type", "unknown"))
+
+            content_type = response.headers.get("content-type", "")
+            if content_type.startswith("application/json"):
+                data = orjson.loads(response.content)
+                pred = data.get("prediction", data.get("result", "unknown"))
+            else:
+                pred = response.content.strip().decode("utf-8", errors="replace")
+            
+            inference_span.set_attribute("inference.prediction", pred)
+            inference_span.set_attribute("inference.outcome", "success")
+            outcome = "success"
 
         except httpx.TimeoutException as e:
             inference_span.set_attribute("inference.outcome", "timeout")
@@ -402,24 +599,15 @@ async def predict(req: PredictRequest, request: Request) -> PredictResponse:
             logger.warning(
                 "Model inference timeout",
                 extra={
-                    "variant": used_variant.value,
+                    "variant": variant,
                     "url": url,
                     "timeout_ms": timeout_ms,
                     "error": str(e),
                     "correlation_id": correlation_id
                 }
             )
-            # Fallback to dummy prediction
-            pred = "positive" if (len(req.text) % 2 == 0) else "negative"
-            logger.info(
-                "Using fallback prediction",
-                extra={
-                    "reason": "timeout",
-                    "fallback_prediction": sanitize_for_json_logging(pred),
-                    "correlation_id": correlation_id
-                }
-            )
-            REQUEST_COUNT.labels(variant=used_variant.value, outcome="timeout").inc()
+            pred = _fallback(req.text)
+            outcome = "timeout"
             
         except httpx.HTTPStatusError as e:
             inference_span.set_attribute("inference.outcome", "http_error")
@@ -429,24 +617,15 @@ async def predict(req: PredictRequest, request: Request) -> PredictResponse:
             logger.warning(
                 "Model inference HTTP error",
                 extra={
-                    "variant": used_variant.value,
+                    "variant": variant,
                     "url": url,
                     "status_code": e.response.status_code,
                     "error": str(e),
                     "correlation_id": correlation_id
                 }
             )
-            # Fallback to dummy prediction
-            pred = "positive" if (len(req.text) % 2 == 0) else "negative"
-            logger.info(
-                "Using fallback prediction",
-                extra={
-                    "reason": "http_error",
-                    "fallback_prediction": sanitize_for_json_logging(pred),
-                    "correlation_id": correlation_id
-                }
-            )
-            REQUEST_COUNT.labels(variant=used_variant.value, outcome="http_error").inc()
+            pred = _fallback(req.text)
+            outcome = "http_error"
             
         except Exception as e:
             inference_span.set_attribute("inference.outcome", "error")
@@ -455,50 +634,143 @@ async def predict(req: PredictRequest, request: Request) -> PredictResponse:
             logger.error(
                 "Model inference unexpected error",
                 extra={
-                    "variant": used_variant.value,
+                    "variant": variant,
                     "url": url,
                     "error": str(e),
                     "error_type": type(e).__name__,
                     "correlation_id": correlation_id
                 }
             )
-            # Fallback to dummy prediction
-            pred = "positive" if (len(req.text) % 2 == 0) else "negative"
-            logger.info(
-                "Using fallback prediction",
-                extra={
-                    "reason": "error",
-                    "fallback_prediction": sanitize_for_json_logging(pred),
-                    "correlation_id": correlation_id
-                }
-            )
-            REQUEST_COUNT.labels(variant=used_variant.value, outcome="error").inc()
+            pred = _fallback(req.text)
+            outcome = "error"
+
+        OUTCOME_COUNTERS[(variant, outcome)].inc()
 
     # Observe latency
-    final_latency = time.time() - start
-    LATENCY_HIST.labels(variant=used_variant.value).observe(final_latency)
+    final_latency_ns = time.perf_counter_ns() - start_ns
+    final_latency = final_latency_ns / 1e9
+    latency_ms = final_latency_ns / 1e6
+    LATENCY_BY_VARIANT[variant].observe(final_latency)
     
     # Add final span attributes
-    add_span_attributes(
-        latency_ms=final_latency * 1000,
-        prediction=pred,
-        outcome="success" if "error" not in locals() else "error"
-    )
+    if is_span_recording():
+        add_span_attributes(
+            latency_ms=latency_ms,
+            prediction=pred,
+            outcome=outcome,
+        )
     
-    logger.info(
-        "Prediction request completed",
-        extra={
-            "total_latency_ms": final_latency * 1000,
-            "prediction": sanitize_for_json_logging(pred),
-            "variant": used_variant.value,
-            "correlation_id": correlation_id
-        }
+    # Single structured event per request; fallbacks carry outcome != success
+    if log_info:
+        logger.info(
+            "Prediction request completed",
+            extra={
+                "outcome": outcome,
+                "variant": variant,
+                "model_name": target_name,
+                "model_version": target_ver or "default",
+                "url": url,
+                "canary_percent": canary_percent,
+                "text_length": len(req.text),
+                "total_latency_ms": latency_ms,
+                "prediction": sanitize_for_json_logging(pred),
+                "correlation_id": correlation_id
+            }
+        )
+
+    return {
+        "prediction": pred,
+        "version": MODEL_VERSION,
+        "latency_ms": latency_ms,
+        "model_variant": variant,
+        "model_version": target_ver if target_ver else "default",
+    }
+
+
+@app.post("/predict", response_model=PredictResponse, tags=["inference"])
+async def predict(req: PredictRequest, request: Request) -> ORJSONResponse:
+    """Main prediction endpoint with canary routing."""
+    # Fields are built from known-good values; returning a Response
+    # skips FastAPI re-validating them against response_model.
+    return ORJSONResponse(
+        await _run_prediction(
+            req, request.app.state, request.headers, get_correlation_id()
+        )
     )
 
-    return PredictResponse(
-        prediction=pred,
-        version=MODEL_VERSION,
-        latency_ms=final_latency * 1000.0,
-        model_variant=used_variant.value,
-        model_version=target_ver if target_ver else "default",
+
+def _prune_jobs(
+    jobs: Dict[str, PredictJob], finished: Deque[Tuple[float, str]], ttl_s: float
+) -> None:
+    """Drop finished jobs older than the TTL, oldest first."""
+    cutoff = time.monotonic() - ttl_s
+    while finished and finished[0][0] < cutoff:
+        _, job_id = finished.popleft()
+        jobs.pop(job_id, None)
+
+
+async def _complete_job(
+    job: PredictJob,
+    req: PredictRequest,
+    state: Any,
+    headers: Mapping[str, str],
+    correlation_id: Optional[str],
+) -> None:
+    try:
+        job.result = await _run_prediction(req, state, headers, correlation_id)
+        job.status = "done"
+    except Exception as e:
+        logger.error(
+            "Async prediction job failed",
+            extra={"job_id": job.job_id, "error": str(e)},
+        )
+        job.status = "failed"
+    job.finished_at = time.monotonic()
+    state.finished_jobs.append((job.finished_at, job.job_id))
+
+
+@app.post(
+    "/predict_async",
+    response_model=PredictJobResponse,
+    status_code=202,
+    tags=["inference"],
+)
+async def predict_async(req: PredictRequest, request: Request) -> ORJSONResponse:
+    """Accept a prediction and run it in the background; poll /predict_result."""
+    state = request.app.state
+    _prune_jobs(state.jobs, state.finished_jobs, state.cfg.job_ttl_s)
+    if len(state.job_tasks) >= state.cfg.max_async_jobs:
+        raise HTTPException(status_code=503, detail="Too many pending async jobs")
+
+    job = PredictJob(job_id=uuid.uuid4().hex)
+    state.jobs[job.job_id] = job
+    task = asyncio.create_task(
+        _complete_job(job, req, state, request.headers, get_correlation_id())
+    )
+    # Keep a strong reference until the task finishes
+    state.job_tasks.add(task)
+    task.add_done_callback(state.job_tasks.discard)
+
+    return ORJSONResponse(
+        {"job_id": job.job_id, "status": job.status, "result": None},
+        status_code=202,
+    )
+
+
+@app.get(
+    "/predict_result/{job_id}",
+    response_model=PredictJobResponse,
+    tags=["inference"],
+)
+async def predict_result(job_id: str, request: Request) -> ORJSONResponse:
+    """Return the state of an async prediction; 202 while it is pending."""
+    state = request.app.state
+    _prune_jobs(state.jobs, state.finished_jobs, state.cfg.job_ttl_s)
+
+    job = state.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job")
+    return ORJSONResponse(
+        {"job_id": job.job_id, "status": job.status, "result": job.result},
+        status_code=202 if job.status == "pending" else 200,
     )
@@ -1,5 +1,7 @@
 from ts.torch_handler.base_handler import BaseHandler
 
+_PARITY = ("positive", "negative")
+
 
 class CustomTextHandler(BaseHandler):
     def initialize(self, context):
@@ -7,14 +9,19 @@ class CustomTextHandler(BaseHandler):
         self.initialized = True
 
     def preprocess(self, data):
-        text = data[0].get("body")
-        if isinstance(text, (bytes, bytearray)):
-            text = text.decode("utf-8")
-        return text
+        # TorchServe delivers one entry per request in the batch
+        texts = []
+        for row in data:
+            text = row.get("body")
+            if isinstance(text, (bytes, bytearray)):
+                text = text.decode("utf-8")
+            texts.append(text)
+        return texts
 
-    def inference(self, text, *args, **kwargs):
+    def inference(self, texts, *args, **kwargs):
         # Dummy model logic: positive if even length
-        return {"prediction": "positive" if len(text) % 2 == 0 else "negative"}
+        return [{"prediction": _PARITY[len(text) & 1]} for text in texts]
 
     def postprocess(self, inference_output):
-        return [inference_output]
+        # One response per request, in batch order
+        return inference_output
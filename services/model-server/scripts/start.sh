@@ -12,6 +12,10 @@ HANDLER="$MS_HOME/handlers/custom_text_handler.py"
 
 SAMPLE_MODEL=${SAMPLE_MODEL:-"true"}
 SAMPLE_MODEL_VERSIONS=${SAMPLE_MODEL_VERSIONS:-"1.0,2.0"}
+# Server-side dynamic batching: TorchServe groups up to BATCH_SIZE queued
+# requests, waiting at most MAX_BATCH_DELAY_MS for the batch to fill
+BATCH_SIZE=${BATCH_SIZE:-32}
+MAX_BATCH_DELAY_MS=${MAX_BATCH_DELAY_MS:-10}
 
 mkdir -p "$MODEL_STORE"
 
@@ -65,7 +69,7 @@ if compgen -G "$MODEL_STORE/custom-text-*.mar" > /dev/null; then
     VERSION=$(echo "$MAR_NAME" | sed -n 's/custom-text-v\(.*\)\.mar/\1/p')
     echo "Registering model $MAR_NAME (version: ${VERSION:-default})..."
     # Register with initial workers to avoid manual scaling
-    RESPONSE=$(curl -sf -X POST "${MGMT_URL}/models?url=${MAR_NAME}&model_name=custom-text&initial_workers=1&synchronous=false" 2>&1)
+    RESPONSE=$(curl -sf -X POST "${MGMT_URL}/models?url=${MAR_NAME}&model_name=custom-text&initial_workers=1&batch_size=${BATCH_SIZE}&max_batch_delay=${MAX_BATCH_DELAY_MS}&synchronous=false" 2>&1)
     if [[ $? -eq 0 ]]; then
       echo "Model registered successfully: $RESPONSE"
     else
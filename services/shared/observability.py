@@ -5,13 +5,14 @@ This module provides standardized logging and tracing configuration
 that can be reused across different inference services.
 """
 
-import json
 import logging
 import os
 import uuid
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any, Dict, Optional
 
+import orjson
 from opentelemetry import trace, baggage, context
 from opentelemetry.exporter.jaeger.thrift import JaegerExporter
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
@@ -22,6 +23,20 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExport
 from pythonjsonlogger import jsonlogger
 
 
+# Correlation ID of the request being handled; set once per request so log
+# records can read it without touching baggage or generating IDs
+_current_correlation_id: ContextVar[Optional[str]] = ContextVar(
+    "correlation_id", default=None
+)
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    val = os.environ.get(name)
+    if val is None:
+        return default
+    return str(val).lower() in {"1", "true", "yes", "on"}
+
+
 class CorrelationIdFilter(logging.Filter):
     """Add correlation ID to log records from OpenTelemetry context."""
     
@@ -36,13 +51,21 @@ class CorrelationIdFilter(logging.Filter):
             record.trace_id = None
             record.span_id = None
             
-        # Get correlation ID from baggage
-        correlation_id = baggage.get_baggage("correlation_id")
-        record.correlation_id = correlation_id or str(uuid.uuid4())
+        # Records outside a request (startup, background work) carry "-"
+        record.correlation_id = _current_correlation_id.get() or "-"
         
         return True
 
 
+class OrjsonFormatter(jsonlogger.JsonFormatter):
+    """JSON log formatter that serializes records with orjson."""
+
+    def jsonify_log_record(self, log_record):
+        return orjson.dumps(
+            log_record, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+
 def setup_logging(service_name: str, log_level: Optional[str] = None) -> logging.Logger:
     """
     Configure structured JSON logging with correlation IDs.
@@ -57,7 +80,7 @@ def setup_logging(service_name: str, log_level: Optional[str] = None) -> logging
     log_level = log_level or os.environ.get("LOG_LEVEL", "INFO").upper()
     
     # Create custom formatter with trace/correlation context
-    formatter = jsonlogger.JsonFormatter(
+    formatter = OrjsonFormatter(
         fmt="%(asctime)s %(name)s %(levelname)s %(message)s %(service_name)s %(trace_id)s %(span_id)s %(correlation_id)s",
         datefmt="%Y-%m-%dT%H:%M:%SZ",
         static_fields={"service_name": service_name}
@@ -110,9 +133,8 @@ def setup_tracing(service_name: str, service_version: str = "unknown") -> trace.
     # Configure exporters based on environment
     exporters = []
     
-    # Jaeger exporter (primary)
-    jaeger_endpoint = os.environ.get("JAEGER_ENDPOINT")
-    if jaeger_endpoint or os.environ.get("JAEGER_AGENT_HOST"):
+    # Legacy Jaeger Thrift/UDP exporter, only when explicitly requested
+    if _env_bool("JAEGER_LEGACY"):
         try:
             jaeger_exporter = JaegerExporter(
                 agent_host_name=os.environ.get("JAEGER_AGENT_HOST", "jaeger"),
@@ -124,8 +146,13 @@ def setup_tracing(service_name: str, service_version: str = "unknown") -> trace.
                 "Failed to configure Jaeger exporter", 
                 extra={"error": str(e)}
             )
+    elif os.environ.get("JAEGER_AGENT_HOST"):
+        logging.getLogger(__name__).warning(
+            "JAEGER_AGENT_HOST is ignored without JAEGER_LEGACY=1; "
+            "set OTLP_ENDPOINT to export traces"
+        )
     
-    # OTLP exporter (alternative)
+    # OTLP/gRPC exporter (primary)
     otlp_endpoint = os.environ.get("OTLP_ENDPOINT")
     if otlp_endpoint:
         try:
@@ -141,12 +168,19 @@ def setup_tracing(service_name: str, service_version: str = "unknown") -> trace.
             )
     
     # Console exporter for development
-    if os.environ.get("TRACE_CONSOLE", "false").lower() == "true":
+    if _env_bool("TRACE_CONSOLE"):
         exporters.append(ConsoleSpanExporter())
     
-    # Add span processors
+    # Add span processors; larger batches, flushed less often than the defaults
     for exporter in exporters:
-        tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
+        tracer_provider.add_span_processor(
+            BatchSpanProcessor(
+                exporter,
+                max_queue_size=4096,
+                max_export_batch_size=512,
+                schedule_delay_millis=2000,
+            )
+        )
     
     tracer = trace.get_tracer(service_name, service_version)
     
@@ -184,26 +218,23 @@ def instrument_httpx():
 
 def _server_request_hook(span: trace.Span, scope: dict):
     """Hook to add custom attributes to server spans."""
+    headers = dict(scope.get("headers", []))
+
+    # Correlation ID from header or generate new one, once per request
+    correlation_id = headers.get(b"x-correlation-id")
+    if correlation_id:
+        correlation_id_str = correlation_id.decode()
+    else:
+        correlation_id_str = str(uuid.uuid4())
+    set_correlation_id(correlation_id_str)
+
     if span and span.is_recording():
-        # Add custom attributes
-        headers = dict(scope.get("headers", []))
-        
         # Add user agent
         user_agent = headers.get(b"user-agent")
         if user_agent:
             span.set_attribute("http.user_agent", user_agent.decode())
-        
-        # Add correlation ID from header or generate new one
-        correlation_id = headers.get(b"x-correlation-id")
-        if not correlation_id:
-            correlation_id = str(uuid.uuid4()).encode()
-        
-        correlation_id_str = correlation_id.decode()
+
         span.set_attribute("correlation_id", correlation_id_str)
-        
-        # Set correlation ID in baggage for downstream services
-        ctx = baggage.set_baggage("correlation_id", correlation_id_str)
-        context.attach(ctx)
 
 
 def _client_request_hook(span: trace.Span, request):
@@ -256,17 +287,33 @@ def add_span_attributes(**attributes):
             span.set_attribute(key, str(value))
 
 
+def is_span_recording() -> bool:
+    """Whether the current span is sampled, i.e. attributes would be kept."""
+    return trace.get_current_span().is_recording()
+
+
 def get_correlation_id() -> Optional[str]:
     """Get the current correlation ID from context."""
-    return baggage.get_baggage("correlation_id")
+    return _current_correlation_id.get() or baggage.get_baggage("correlation_id")
 
 
 def set_correlation_id(correlation_id: str):
-    """Set correlation ID in the current context."""
+    """Set correlation ID in the current context and baggage."""
+    _current_correlation_id.set(correlation_id)
+    # Baggage carries it to downstream services
     ctx = baggage.set_baggage("correlation_id", correlation_id)
     context.attach(ctx)
 
 
+_ESCAPE_TABLE = str.maketrans({
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+    '"': '\\"',
+    "\\": "\\\\",
+})
+
+
 def sanitize_for_json_logging(value: Any) -> str:
     """
     Sanitize a value for safe inclusion in JSON logs.
@@ -290,17 +337,16 @@ def sanitize_for_json_logging(value: Any) -> str:
     if str_value.strip().startswith(('{', '[', '"')) and len(str_value) > 1:
         try:
             # Try to parse as JSON
-            parsed = json.loads(str_value)
+            parsed = orjson.loads(str_value)
             # Re-serialize with proper escaping
-            return json.dumps(parsed, separators=(',', ':'), ensure_ascii=False)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.dumps(parsed).decode("utf-8")
+        except (orjson.JSONDecodeError, TypeError):
             # If it's not valid JSON, escape it as a string
             pass
     
-    # For non-JSON strings, escape special characters
-    # Replace newlines, tabs, and other problematic characters
-    sanitized = str_value.replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
-    sanitized = sanitized.replace('"', '\\"').replace('\\', '\\\\')
+    # For non-JSON strings, escape newlines, tabs, quotes and backslashes
+    # in a single pass
+    sanitized = str_value.translate(_ESCAPE_TABLE)
     
     # Truncate very long strings to prevent log bloat
     if len(sanitized) > 1000:
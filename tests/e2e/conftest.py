@@ -6,14 +6,19 @@ multiple inference services.
 """
 import asyncio
 import os
+import random
+import re
 import time
-import uuid
-from datetime import datetime, timedelta
+import types
+from datetime import datetime
+from itertools import cycle, islice
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import httpx
+import orjson
 import pytest
+import pytest_asyncio
 from prometheus_api_client import PrometheusConnect
 
 # Ensure repository root is importable for tests
@@ -23,6 +28,81 @@ root = Path(__file__).resolve().parents[2]
 if str(root) not in sys.path:
     sys.path.insert(0, str(root))
 
+# Run the async fixtures on uvloop when it is installed; set before
+# pytest-asyncio creates its event loop.
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional speedup
+        uvloop = None
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# Backend polling backoff: first retry after ~100 ms, growing to at most 2 s
+POLL_INITIAL_DELAY_S = 0.1
+POLL_MAX_DELAY_S = 2.0
+POLL_BACKOFF_FACTOR = 1.6
+
+# Fail fast on connect; Prometheus queries get a longer read budget
+HTTP_TIMEOUT = httpx.Timeout(connect=2.0, read=10.0, write=5.0, pool=1.0)
+PROM_QUERY_TIMEOUT = httpx.Timeout(connect=2.0, read=30.0, write=5.0, pool=1.0)
+
+# Loki log queries look back over the last 5 minutes
+LOKI_LOOKBACK_NS = 5 * 60 * 1_000_000_000
+
+
+async def _backoff_sleep(delay: float) -> float:
+    """Sleep for ``delay`` plus a little jitter and return the next delay."""
+    await asyncio.sleep(delay + random.uniform(0, 0.05))
+    return min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY_S)
+
+
+# Inference services under test, built once at import time and shared read-only
+_SERVICE_CONFIGS = types.MappingProxyType({
+    "inference": {
+        "name": "seraphim-inference",
+        "port": 8088,
+        "predict_endpoint": "/predict",
+        "metrics_endpoint": "/metrics",
+        "health_endpoint": "/healthz",
+        "observability_endpoint": "/observability/health",
+        "default_model": "primary",
+        "expected_metrics": [
+            "seraphim_inference_requests_total",
+            "seraphim_inference_latency_seconds",
+        ],
+        "prometheus_job": "seraphim-gateway",
+    },
+    "sentiment-analysis": {
+        "name": "seraphim-sentiment",
+        "port": 8089,
+        "predict_endpoint": "/analyze",
+        "metrics_endpoint": "/metrics", 
+        "health_endpoint": "/health",
+        "observability_endpoint": "/observability/status",
+        "default_model": "sentiment-v1",
+        "expected_metrics": [
+            "seraphim_sentiment_requests_total",
+            "seraphim_sentiment_latency_seconds",
+        ],
+        "prometheus_job": "seraphim-sentiment",
+    },
+    "text-classification": {
+        "name": "seraphim-classifier",
+        "port": 8090,
+        "predict_endpoint": "/classify",
+        "metrics_endpoint": "/metrics",
+        "health_endpoint": "/health",
+        "observability_endpoint": "/observability/status", 
+        "default_model": "classifier-v1",
+        "expected_metrics": [
+            "seraphim_classifier_requests_total",
+            "seraphim_classifier_latency_seconds",
+        ],
+        "prometheus_job": "seraphim-classifier",
+    }
+})
+
 
 # Test configuration
 @pytest.fixture(scope="session")
@@ -43,73 +123,54 @@ def test_config():
 @pytest.fixture(scope="session")
 def service_configs():
     """Configuration for different inference services."""
-    return {
-        "inference": {
-            "name": "seraphim-inference",
-            "port": 8088,
-            "predict_endpoint": "/predict",
-            "metrics_endpoint": "/metrics",
-            "health_endpoint": "/healthz",
-            "observability_endpoint": "/observability/health",
-            "default_model": "primary",
-            "expected_metrics": [
-                "seraphim_inference_requests_total",
-                "seraphim_inference_latency_seconds",
-            ],
-            "prometheus_job": "seraphim-gateway",
-        },
-        "sentiment-analysis": {
-            "name": "seraphim-sentiment",
-            "port": 8089,
-            "predict_endpoint": "/analyze",
-            "metrics_endpoint": "/metrics", 
-            "health_endpoint": "/health",
-            "observability_endpoint": "/observability/status",
-            "default_model": "sentiment-v1",
-            "expected_metrics": [
-                "seraphim_sentiment_requests_total",
-                "seraphim_sentiment_latency_seconds",
-            ],
-            "prometheus_job": "seraphim-sentiment",
-        },
-        "text-classification": {
-            "name": "seraphim-classifier",
-            "port": 8090,
-            "predict_endpoint": "/classify",
-            "metrics_endpoint": "/metrics",
-            "health_endpoint": "/health",
-            "observability_endpoint": "/observability/status", 
-            "default_model": "classifier-v1",
-            "expected_metrics": [
-                "seraphim_classifier_requests_total",
-                "seraphim_classifier_latency_seconds",
-            ],
-            "prometheus_job": "seraphim-classifier",
-        }
-    }
+    return _SERVICE_CONFIGS
 
 
 @pytest.fixture(scope="function")
 def correlation_id(test_config):
     """Generate unique correlation ID for test tracing."""
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    unique_id = str(uuid.uuid4())[:8]
-    return f"{test_config['correlation_prefix']}-{timestamp}-{unique_id}"
+    return f"{test_config['correlation_prefix']}-{time.time_ns():x}"
 
 
 @pytest.fixture(scope="session")
 def prometheus_client(test_config):
-    """Prometheus client for metrics validation."""
+    """Synchronous Prometheus client; async tests use the validator's prom_query."""
     return PrometheusConnect(url=test_config["prometheus_url"])
 
 
-@pytest.fixture(scope="session") 
-async def http_client():
-    """Async HTTP client for service requests."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the session, so the shared client outlives each test."""
+    loop = asyncio.get_event_loop_policy().new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_http_client():
+    """Pooled async HTTP client shared by every fixture in the session."""
+    # HTTP/2 is negotiated via ALPN, so it applies to https:// backends;
+    # plain http:// URLs keep using pooled HTTP/1.1 connections.
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=HTTP_TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    ) as client:
         yield client
 
 
+@pytest_asyncio.fixture(scope="session")
+async def http_client(shared_http_client):
+    """Async HTTP client for service requests."""
+    return shared_http_client
+
+
+@pytest.fixture(scope="session")
+def unreachable_cache():
+    """Backends (prometheus/jaeger/loki) found unreachable during this run."""
+    return set()
+
+
 @pytest.fixture(scope="function")
 def test_timeframe():
     """Provide test time boundaries for queries."""
@@ -118,8 +179,34 @@ def test_timeframe():
     # Test cleanup happens after yield
 
 
-@pytest.fixture(scope="session")
-async def observability_stack_health(test_config):
+# Health check path per observability backend
+_HEALTH_PATHS = {
+    "Prometheus": "/-/healthy",
+    "Jaeger": "/",  # Jaeger UI returns 200 for root
+    "Loki": "/ready",
+    "Grafana": "/api/health",
+}
+
+
+async def _probe(client: httpx.AsyncClient, url: str, service_name: str):
+    """Return (service_name, healthy) for one observability backend."""
+    try:
+        health_url = f"{url}{_HEALTH_PATHS[service_name]}"
+        response = await client.get(health_url)
+        return service_name, response.status_code < 400
+    except Exception as e:
+        print(f"Warning: {service_name} health check failed: {e}")
+        return service_name, False
+
+
+def _logql_alternation(values) -> str:
+    """Regex alternation of literal ``values``, safe inside a LogQL string."""
+    # Backslashes from re.escape must themselves be escaped in a LogQL string
+    return "|".join(re.escape(v).replace("\\", "\\\\") for v in values)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def observability_stack_health(test_config, shared_http_client):
     """Verify observability stack is healthy before running tests."""
     endpoints = [
         (test_config["prometheus_url"], "Prometheus"),
@@ -128,26 +215,11 @@ async def observability_stack_health(test_config):
         (test_config["grafana_url"], "Grafana"),
     ]
     
-    healthy_services = {}
-    
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        for url, service_name in endpoints:
-            try:
-                # Different health check endpoints for different services
-                if "prometheus" in url:
-                    health_url = f"{url}/-/healthy"
-                elif "jaeger" in url:
-                    health_url = f"{url}/"  # Jaeger UI returns 200 for root
-                elif "loki" in url:
-                    health_url = f"{url}/ready"
-                else:  # Grafana
-                    health_url = f"{url}/api/health"
-                
-                response = await client.get(health_url)
-                healthy_services[service_name] = response.status_code < 400
-            except Exception as e:
-                print(f"Warning: {service_name} health check failed: {e}")
-                healthy_services[service_name] = False
+    # Probe all backends concurrently
+    results = await asyncio.gather(
+        *(_probe(shared_http_client, url, name) for url, name in endpoints)
+    )
+    healthy_services = dict(results)
     
     # Require at least Prometheus to be healthy
     if not healthy_services.get("Prometheus", False):
@@ -156,194 +228,432 @@ async def observability_stack_health(test_config):
     return healthy_services
 
 
-@pytest.fixture(scope="function")
-async def service_client(test_config, service_configs, correlation_id):
-    """Client for making requests to inference services with observability headers."""
+class ServiceClient:
+    """Client for the inference services that sets observability headers."""
+
+    def __init__(self, config, service_configs, client, correlation_id=None):
+        self.client = client
+        self.config = config
+        self.service_configs = service_configs
+        self._service_urls = {
+            name: f"http://localhost:{c['port']}"
+            for name, c in service_configs.items()
+        }
+        # Default correlation ID for calls that don't pass one
+        self.correlation_id = correlation_id
+        self.base_headers = {
+            "User-Agent": "SeraphimE2ETest/1.0",
+            "Content-Type": "application/json"
+        }
     
-    class ServiceClient:
-        def __init__(self, config, service_configs, correlation_id):
-            self.config = config
-            self.service_configs = service_configs
-            self.correlation_id = correlation_id
-            self.base_headers = {
-                "X-Correlation-ID": correlation_id,
-                "User-Agent": "SeraphimE2ETest/1.0",
-                "Content-Type": "application/json"
-            }
+    def bind(self, correlation_id: str):
+        """Return a view of this client that defaults to correlation_id."""
+        return ServiceClient(
+            self.config, self.service_configs, self.client, correlation_id
+        )
+    
+    async def make_request(
+        self,
+        service_name: str,
+        endpoint: str = None,
+        correlation_id: Optional[str] = None,
+        **kwargs,
+    ):
+        """Make request to specified service."""
+        if service_name not in self.service_configs:
+            raise ValueError(f"Unknown service: {service_name}")
         
-        async def make_request(self, service_name: str, endpoint: str = None, **kwargs):
-            """Make request to specified service."""
-            if service_name not in self.service_configs:
-                raise ValueError(f"Unknown service: {service_name}")
-            
-            service_config = self.service_configs[service_name]
-            port = service_config["port"]
-            endpoint = endpoint or service_config["predict_endpoint"]
-            
-            url = f"http://localhost:{port}{endpoint}"
-            
-            # Merge headers
-            headers = {**self.base_headers, **kwargs.pop("headers", {})}
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                return await client.post(url, headers=headers, **kwargs)
+        service_config = self.service_configs[service_name]
+        endpoint = endpoint or service_config["predict_endpoint"]
+        url = self._service_urls[service_name] + endpoint
         
-        async def predict(self, service_name: str, text: str, model: str = None):
-            """Make prediction request with standard payload."""
-            service_config = self.service_configs[service_name]
-            model = model or service_config["default_model"]
-            
-            payload = {"text": text, "model": model}
-            
-            return await self.make_request(
-                service_name,
-                service_config["predict_endpoint"],
-                json=payload
-            )
+        # Merge headers
+        headers = {
+            **self.base_headers,
+            "X-Correlation-ID": correlation_id or self.correlation_id,
+            **kwargs.pop("headers", {}),
+        }
         
-        async def health_check(self, service_name: str):
-            """Check service health."""
-            service_config = self.service_configs[service_name]
-            port = service_config["port"] 
-            url = f"http://localhost:{port}{service_config['health_endpoint']}"
-            
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                return await client.get(url)
+        return await self.client.post(url, headers=headers, **kwargs)
+    
+    async def predict(
+        self,
+        service_name: str,
+        text: str,
+        model: str = None,
+        correlation_id: Optional[str] = None,
+    ):
+        """Make prediction request with standard payload."""
+        service_config = self.service_configs[service_name]
+        model = model or service_config["default_model"]
+        
+        payload = {"text": text, "model": model}
+        
+        return await self.make_request(
+            service_name,
+            service_config["predict_endpoint"],
+            correlation_id=correlation_id,
+            json=payload
+        )
+    
+    async def health_check(self, service_name: str):
+        """Check service health."""
+        url = (
+            self._service_urls[service_name]
+            + self.service_configs[service_name]["health_endpoint"]
+        )
+        
+        return await self.client.get(url)
     
-    return ServiceClient(test_config, service_configs, correlation_id)
+    async def health_check_all(self) -> Dict[str, int]:
+        """Check every configured service concurrently.
 
+        Returns the health endpoint status code per service, or -1 when the
+        service could not be reached.
+        """
+        names = list(self.service_configs)
+        results = await asyncio.gather(
+            *(self.health_check(name) for name in names), return_exceptions=True
+        )
+        return {
+            name: -1 if isinstance(result, Exception) else result.status_code
+            for name, result in zip(names, results)
+        }
 
-@pytest.fixture(scope="function") 
-def observability_validator(test_config, prometheus_client, correlation_id):
-    """Utilities for validating observability data."""
+
+@pytest.fixture(scope="module")
+def module_service_client(test_config, service_configs, shared_http_client):
+    """Module-wide service client; correlation IDs are supplied per call."""
+    return ServiceClient(test_config, service_configs, shared_http_client)
+
+
+@pytest.fixture(scope="function")
+def service_client(module_service_client, correlation_id):
+    """Client for making requests to inference services with observability headers."""
+    return module_service_client.bind(correlation_id)
+
+
+class BackendUnreachable(TimeoutError):
+    """A backend already failed to answer earlier in this run.
+
+    Tests that tolerate a missing pillar catch it as a TimeoutError; anywhere
+    else it propagates and the test is reported as skipped.
+    """
+
+
+class ObservabilityValidator:
+    """Polls Prometheus, Jaeger and Loki for data tied to a correlation ID."""
+
+    def __init__(self, config, client, unreachable, correlation_id=None):
+        self.client = client
+        self.unreachable = unreachable
+        self.config = config
+        self.prometheus_url = config["prometheus_url"]
+        # Default correlation ID for calls that don't pass one
+        self.correlation_id = correlation_id
+        self.jaeger_url = config["jaeger_url"]
+        self.loki_url = config["loki_url"]
+        self.grafana_url = config["grafana_url"]
+    
+    def bind(self, correlation_id: str):
+        """Return a view of this validator that defaults to correlation_id."""
+        return ObservabilityValidator(
+            self.config,
+            self.client,
+            self.unreachable,
+            correlation_id,
+        )
+    
+    def _skip_if_unreachable(self, backend: str):
+        if backend in self.unreachable:
+            raise BackendUnreachable(f"{backend} was unreachable earlier in this run")
+    
+    def _timed_out(self, backend: str, contacted: bool, message: str):
+        """Remember a backend that never answered, then raise TimeoutError."""
+        if not contacted:
+            self.unreachable.add(backend)
+        raise TimeoutError(message)
+    
+    async def prom_query(self, query: str) -> List[Dict]:
+        """Run an instant PromQL query without blocking the event loop."""
+        response = await self.client.get(
+            f"{self.prometheus_url}/api/v1/query",
+            params={"query": query},
+            timeout=PROM_QUERY_TIMEOUT,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)["data"]["result"]
     
-    class ObservabilityValidator:
-        def __init__(self, config, prometheus_client, correlation_id):
-            self.config = config
-            self.prometheus = prometheus_client
-            self.correlation_id = correlation_id
-            self.jaeger_url = config["jaeger_url"]
-            self.loki_url = config["loki_url"]
-            self.grafana_url = config["grafana_url"]
+    async def wait_for_metrics(self, metric_name: str, labels: Dict = None, timeout: int = 30):
+        """Wait for metrics to appear in Prometheus."""
+        self._skip_if_unreachable("prometheus")
+        query = metric_name
+        if labels:
+            label_pairs = [f'{k}="{v}"' for k, v in labels.items()]
+            query = f'{metric_name}{{{",".join(label_pairs)}}}'
+        contacted = False
+        delay = POLL_INITIAL_DELAY_S
+        start_time = time.time()
         
-        async def wait_for_metrics(self, metric_name: str, labels: Dict = None, timeout: int = 30):
-            """Wait for metrics to appear in Prometheus."""
-            start_time = time.time()
-            
-            while time.time() - start_time < timeout:
-                try:
-                    query = metric_name
-                    if labels:
-                        label_pairs = [f'{k}="{v}"' for k, v in labels.items()]
-                        query = f'{metric_name}{{{",".join(label_pairs)}}}'
-                    
-                    result = self.prometheus.custom_query(query)
-                    if result:
-                        return result
-                except Exception as e:
-                    print(f"Metrics query failed: {e}")
-                
-                await asyncio.sleep(1)
+        while time.time() - start_time < timeout:
+            try:
+                result = await self.prom_query(query)
+                contacted = True
+                if result:
+                    return result
+            except Exception as e:
+                print(f"Metrics query failed: {e}")
             
-            raise TimeoutError(f"Metric {metric_name} not found within {timeout}s")
+            delay = await _backoff_sleep(delay)
         
-        async def validate_traces(self, service_name: str, timeout: int = 30):
-            """Validate traces exist for correlation ID."""
-            start_time = time.time()
-            
-            while time.time() - start_time < timeout:
-                try:
-                    url = f"{self.jaeger_url}/api/traces"
-                    params = {
-                        "service": service_name,
-                        "tag": f"correlation_id:{self.correlation_id}",
-                        "limit": 10
-                    }
-                    
-                    async with httpx.AsyncClient(timeout=10.0) as client:
-                        response = await client.get(url, params=params)
-                        if response.status_code == 200:
-                            data = response.json()
-                            if data.get("data") and len(data["data"]) > 0:
-                                return data["data"]
-                except Exception as e:
-                    print(f"Trace validation failed: {e}")
-                
-                await asyncio.sleep(2)
+        self._timed_out(
+            "prometheus",
+            contacted,
+            f"Metric {metric_name} not found within {timeout}s",
+        )
+    
+    async def wait_for_metrics_batch(
+        self, metric_names: List[str], labels: Dict = None, timeout: int = 30
+    ) -> Dict[str, List[Dict]]:
+        """Wait until every metric name has at least one series in Prometheus.
+
+        All names are checked in a single /api/v1/series call per poll.
+        Returns the matching series grouped by metric name.
+        """
+        self._skip_if_unreachable("prometheus")
+        selector = ""
+        if labels:
+            selector = "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+        params = [("match[]", f"{name}{selector}") for name in metric_names]
+        url = f"{self.prometheus_url}/api/v1/series"
+        contacted = False
+        delay = POLL_INITIAL_DELAY_S
+        start_time = time.time()
+        
+        while time.time() - start_time < timeout:
+            try:
+                response = await self.client.get(
+                    url, params=params, timeout=PROM_QUERY_TIMEOUT
+                )
+                contacted = True
+                if response.status_code == 200:
+                    found: Dict[str, List[Dict]] = {}
+                    for series in orjson.loads(response.content).get("data", []):
+                        found.setdefault(series.get("__name__"), []).append(series)
+                    if all(name in found for name in metric_names):
+                        return found
+            except Exception as e:
+                print(f"Metrics series query failed: {e}")
             
-            raise TimeoutError(f"No traces found for correlation ID {self.correlation_id}")
+            delay = await _backoff_sleep(delay)
         
-        async def validate_logs(self, service_name: str, timeout: int = 30):
-            """Validate logs exist for correlation ID."""
-            start_time = time.time()
+        self._timed_out(
+            "prometheus",
+            contacted,
+            f"Metrics {', '.join(metric_names)} not all found within {timeout}s",
+        )
+    
+    async def validate_traces(
+        self,
+        service_name: str,
+        timeout: int = 30,
+        correlation_id: Optional[str] = None,
+    ):
+        """Validate traces exist for correlation ID."""
+        correlation_id = correlation_id or self.correlation_id
+        self._skip_if_unreachable("jaeger")
+        url = f"{self.jaeger_url}/api/traces"
+        params = {
+            "service": service_name,
+            "tag": f"correlation_id:{correlation_id}",
+            "limit": 10
+        }
+        contacted = False
+        delay = POLL_INITIAL_DELAY_S
+        start_time = time.time()
+        
+        while time.time() - start_time < timeout:
+            try:
+                response = await self.client.get(url, params=params)
+                contacted = True
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    if data.get("data") and len(data["data"]) > 0:
+                        return data["data"]
+            except Exception as e:
+                print(f"Trace validation failed: {e}")
             
-            while time.time() - start_time < timeout:
-                try:
-                    url = f"{self.loki_url}/loki/api/v1/query_range"
-                    
-                    # Build LogQL query for correlation ID
-                    query = f'{{service="{service_name}"}} |= "{self.correlation_id}"'
-                    
-                    # Query last 5 minutes
-                    end_time = datetime.utcnow()
-                    start_query_time = end_time - timedelta(minutes=5)
-                    
-                    params = {
-                        "query": query,
-                        "start": int(start_query_time.timestamp() * 1e9),  # nanoseconds
-                        "end": int(end_time.timestamp() * 1e9),
-                        "limit": 100
-                    }
-                    
-                    async with httpx.AsyncClient(timeout=10.0) as client:
-                        response = await client.get(url, params=params)
-                        if response.status_code == 200:
-                            data = response.json()
-                            results = data.get("data", {}).get("result", [])
-                            if results:
-                                return results
-                except Exception as e:
-                    print(f"Log validation failed: {e}")
-                
-                await asyncio.sleep(2)
+            delay = await _backoff_sleep(delay)
+        
+        self._timed_out(
+            "jaeger",
+            contacted,
+            f"No traces found for correlation ID {correlation_id}",
+        )
+    
+    async def validate_logs(
+        self,
+        service_name: str,
+        timeout: int = 30,
+        correlation_id: Optional[str] = None,
+    ):
+        """Validate logs exist for correlation ID."""
+        correlation_id = correlation_id or self.correlation_id
+        self._skip_if_unreachable("loki")
+        url = f"{self.loki_url}/loki/api/v1/query_range"
+        query = f'{{service="{service_name}"}} |= "{correlation_id}"'
+        contacted = False
+        delay = POLL_INITIAL_DELAY_S
+        start_time = time.time()
+        
+        while time.time() - start_time < timeout:
+            try:
+                end_ns = time.time_ns()
+                params = {
+                    "query": query,
+                    "start": end_ns - LOKI_LOOKBACK_NS,
+                    "end": end_ns,
+                    "limit": 100,
+                }
+                response = await self.client.get(url, params=params)
+                contacted = True
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    results = data.get("data", {}).get("result", [])
+                    if results:
+                        return results
+            except Exception as e:
+                print(f"Log validation failed: {e}")
             
-            raise TimeoutError(f"No logs found for correlation ID {self.correlation_id}")
+            delay = await _backoff_sleep(delay)
+        
+        self._timed_out(
+            "loki",
+            contacted,
+            f"No logs found for correlation ID {correlation_id}",
+        )
     
-    return ObservabilityValidator(test_config, prometheus_client, correlation_id)
+    async def validate_logs_multi(
+        self,
+        service_names: List[str],
+        timeout: int = 30,
+        correlation_id: Optional[str] = None,
+    ) -> Dict[str, List[Dict]]:
+        """Fetch logs for several services with one Loki query per poll.
+
+        Returns log streams grouped by service name, as soon as every service
+        has some or when ``timeout`` elapses; services without logs map to [].
+        """
+        correlation_id = correlation_id or self.correlation_id
+        self._skip_if_unreachable("loki")
+        url = f"{self.loki_url}/loki/api/v1/query_range"
+        query = (
+            f'{{service=~"({_logql_alternation(service_names)})"}} '
+            f'|= "{correlation_id}"'
+        )
+        grouped: Dict[str, List[Dict]] = {name: [] for name in service_names}
+        contacted = False
+        delay = POLL_INITIAL_DELAY_S
+        start_time = time.time()
+        
+        while time.time() - start_time < timeout:
+            try:
+                end_ns = time.time_ns()
+                params = {
+                    "query": query,
+                    "start": end_ns - LOKI_LOOKBACK_NS,
+                    "end": end_ns,
+                    "limit": 100 * len(service_names),
+                }
+                response = await self.client.get(url, params=params)
+                contacted = True
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    grouped = {name: [] for name in service_names}
+                    for stream in data.get("data", {}).get("result", []):
+                        service = stream.get("stream", {}).get("service")
+                        if service in grouped:
+                            grouped[service].append(stream)
+                    if all(grouped.values()):
+                        return grouped
+            except Exception as e:
+                print(f"Log validation failed: {e}")
+            
+            delay = await _backoff_sleep(delay)
+        
+        if not contacted:
+            self._timed_out(
+                "loki",
+                contacted,
+                f"No logs found for correlation ID {correlation_id}",
+            )
+        return grouped
+
+
+@pytest.fixture(scope="module")
+def module_observability_validator(test_config, shared_http_client, unreachable_cache):
+    """Module-wide validator; correlation IDs are supplied per call."""
+    return ObservabilityValidator(test_config, shared_http_client, unreachable_cache)
 
 
 @pytest.fixture(scope="function")
+def observability_validator(module_observability_validator, correlation_id):
+    """Utilities for validating observability data."""
+    return module_observability_validator.bind(correlation_id)
+
+
+# Sample request texts, cycled by test_data_generator
+_TEST_TEXTS = (
+    "This is a positive sentiment example for testing observability",
+    "Negative example with error handling validation",
+    "Neutral text for classification and routing tests",
+    "Long text example to test latency measurements and histogram buckets in observability stack",
+    "Short text",
+)
+
+
+@pytest.fixture(scope="session")
 def test_data_generator():
     """Generate deterministic test data for consistent testing."""
     
-    test_texts = [
-        "This is a positive sentiment example for testing observability",
-        "Negative example with error handling validation",
-        "Neutral text for classification and routing tests",
-        "Long text example to test latency measurements and histogram buckets in observability stack",
-        "Short text",
-    ]
-    
     def generate_request_batch(count: int = 5, service_type: str = "inference"):
         """Generate batch of test requests."""
-        batch = []
-        for i in range(count):
-            text = test_texts[i % len(test_texts)]
-            batch.append({
+        model = "primary" if service_type == "inference" else f"{service_type}-v1"
+        texts = islice(cycle(_TEST_TEXTS), count)
+        return [
+            {
                 "text": f"{text} (batch-{i})",
-                "model": "primary" if service_type == "inference" else f"{service_type}-v1",
+                "model": model,
                 "expected_variant": "baseline" if i % 3 != 0 else "candidate"  # Roughly 33% canary
-            })
-        return batch
+            }
+            for i, text in enumerate(texts)
+        ]
     
     return {"generate_request_batch": generate_request_batch}
 
 
-@pytest.fixture(scope="function")
-async def cleanup_test_data(correlation_id, test_timeframe):
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Skip tests stopped by an unreachable backend and flag skipped tests."""
+    outcome = yield
+    report = outcome.get_result()
+    if call.excinfo is not None and call.excinfo.errisinstance(BackendUnreachable):
+        report.outcome = "skipped"
+        reason = f"Skipped: {call.excinfo.value}"
+        report.longrepr = (str(item.path), item.location[1], reason)
+    if report.when == "call" and report.skipped:
+        item.user_properties.append(("skipped_early", True))
+
+
+@pytest_asyncio.fixture(scope="function")
+async def cleanup_test_data(request, correlation_id, test_timeframe):
     """Cleanup fixture to ensure test isolation."""
     yield  # Test runs here
     
+    # Nothing to clean up for tests that skipped before touching a service
+    if any(name == "skipped_early" for name, _ in request.node.user_properties):
+        return
+    
     # Post-test cleanup
     # Note: In practice, we rely on time-bounded queries rather than 
     # active cleanup since observability data is append-only
@@ -2,9 +2,19 @@
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import os
 
 
+@pytest.fixture(scope="module")
+def http_session():
+    """Pooled session shared by the availability checks in this module."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+    yield session
+    session.close()
+
+
 class TestBasicE2E:
     """Basic end-to-end tests."""
     
@@ -12,26 +22,26 @@ class TestBasicE2E:
         """Placeholder test to ensure test runner works."""
         assert True
     
-    def test_inference_service_available(self):
+    def test_inference_service_available(self, http_session):
         """Test that inference service is available (if URL is set)."""
         inference_url = os.getenv('TEST_INFERENCE_URL')
         if not inference_url:
             pytest.skip("TEST_INFERENCE_URL not set")
         
         try:
-            response = requests.get(f"{inference_url}/healthz", timeout=5)
+            response = http_session.get(f"{inference_url}/healthz", timeout=5)
             assert response.status_code == 200
         except requests.exceptions.RequestException:
             pytest.skip("Inference service not available")
     
-    def test_prometheus_available(self):
+    def test_prometheus_available(self, http_session):
         """Test that Prometheus is available (if URL is set)."""
         prometheus_url = os.getenv('TEST_PROMETHEUS_URL')
         if not prometheus_url:
             pytest.skip("TEST_PROMETHEUS_URL not set")
         
         try:
-            response = requests.get(f"{prometheus_url}/-/ready", timeout=5)
+            response = http_session.get(f"{prometheus_url}/-/ready", timeout=5)
             assert response.status_code == 200
         except requests.exceptions.RequestException:
             pytest.skip("Prometheus not available")
@@ -5,10 +5,76 @@ Tests verify that metrics, logs, and traces work together correctly
 and provide complete observability across the inference pipeline.
 """
 import asyncio
-import json
 import pytest
+import re
 import time
-from typing import Dict, List, Set
+from array import array
+from statistics import fmean
+
+
+# Error indicators in log lines, matched case-insensitively without copying
+_ERR_RE = re.compile(r"error|fallback", re.I)
+
+
+async def _poll_until(pred, timeout, initial=0.1, factor=1.5, max_delay=2.0):
+    """Await ``pred()`` with exponential backoff until it returns a truthy value.
+
+    Returns that value, or None if ``timeout`` seconds pass first.
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while True:
+        result = await pred()
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * factor, max_delay)
+
+
+def _span_has_tag(span, key, value) -> bool:
+    """True if the span carries tag ``key`` with ``value``, without a tag dict."""
+    return any(
+        tag["key"] == key and tag["value"] == value for tag in span.get("tags", ())
+    )
+
+
+def _find_trace_with(traces, predicate):
+    """Return ``(trace, span)`` for the first span matching ``predicate``."""
+    for trace in traces:
+        for span in trace["spans"]:
+            if predicate(span):
+                return trace, span
+    return None, None
+
+
+async def _metric_sum(validator, metric_name) -> float:
+    """Total of ``metric_name`` across all series, summed by Prometheus."""
+    result = await validator.prom_query(f"sum({metric_name})")
+    return float(result[0]["value"][1]) if result else 0.0
+
+
+async def _baseline_sum(validator, metric_name, timeout=5) -> float:
+    """Like ``_metric_sum`` but waits briefly for the metric; 0 if absent."""
+    try:
+        result = await validator.wait_for_metrics(
+            f"sum({metric_name})", timeout=timeout
+        )
+    except TimeoutError:
+        return 0.0
+    return float(result[0]["value"][1])
+
+
+async def _metric_incremented(validator, metric_name, baseline_count):
+    """Return the metric's total once it exceeds ``baseline_count``."""
+    try:
+        total = await _metric_sum(validator, metric_name)
+    except Exception as e:
+        print(f"Metrics query failed: {e}")
+        return None
+    return total if total > baseline_count else None
 
 
 class TestObservabilityIntegration:
@@ -33,13 +99,7 @@ class TestObservabilityIntegration:
         
         # Record baseline metrics
         metric_name = service_config["expected_metrics"][0]
-        try:
-            baseline_metrics = await observability_validator.wait_for_metrics(
-                metric_name, timeout=5
-            )
-            baseline_count = sum(float(r["value"][1]) for r in baseline_metrics)
-        except TimeoutError:
-            baseline_count = 0
+        baseline_count = await _baseline_sum(observability_validator, metric_name)
         
         # Make test request with unique text for correlation
         test_text = f"End-to-end correlation test {int(time.time())}"
@@ -50,13 +110,14 @@ class TestObservabilityIntegration:
         )
         assert response.status_code == 200
         
-        # Wait for observability data to propagate
-        await asyncio.sleep(3)
-        
-        # Validate metrics increased
-        metrics = await observability_validator.wait_for_metrics(metric_name)
-        new_count = sum(float(r["value"][1]) for r in metrics)
-        assert new_count > baseline_count, "Metrics did not increment"
+        # Validate metrics increased, polling until the scrape catches up
+        new_count = await _poll_until(
+            lambda: _metric_incremented(
+                observability_validator, metric_name, baseline_count
+            ),
+            timeout=30,
+        )
+        assert new_count is not None, "Metrics did not increment"
         
         # Validate trace exists with correlation ID
         traces = await observability_validator.validate_traces(
@@ -64,17 +125,10 @@ class TestObservabilityIntegration:
             timeout=30
         )
         
-        trace_found = False
-        trace_id = None
-        for trace in traces:
-            for span in trace["spans"]:
-                span_tags = {tag["key"]: tag["value"] for tag in span.get("tags", [])}
-                if span_tags.get("correlation_id") == correlation_id:
-                    trace_found = True
-                    trace_id = trace["traceID"]
-                    break
-            if trace_found:
-                break
+        trace_found, _ = _find_trace_with(
+            traces, lambda span: _span_has_tag(span, "correlation_id", correlation_id)
+        )
+        trace_id = trace_found["traceID"] if trace_found else None
         
         assert trace_found, "No trace found with correlation ID"
         
@@ -84,15 +138,11 @@ class TestObservabilityIntegration:
             timeout=30
         )
         
-        log_found = False
-        for log_stream in logs:
-            for log_entry in log_stream.get("values", []):
-                timestamp, log_message = log_entry
-                if correlation_id in log_message and test_text in log_message:
-                    log_found = True
-                    break
-            if log_found:
-                break
+        log_found = any(
+            correlation_id in log_message and test_text in log_message
+            for log_stream in logs
+            for _, log_message in log_stream.get("values", ())
+        )
         
         assert log_found, "No log found with correlation ID and test text"
         
@@ -117,21 +167,12 @@ class TestObservabilityIntegration:
         if len(available_services) < 1:
             pytest.skip("No configured services available")
         
-        # Generate requests across all available services
-        service_results = {}
-        
-        for service_name in available_services:
+        async def _baseline_and_predict(service_name):
             service_config = service_configs[service_name]
             
             # Get baseline metrics
             metric_name = service_config["expected_metrics"][0]
-            try:
-                baseline_metrics = await observability_validator.wait_for_metrics(
-                    metric_name, timeout=5
-                )
-                baseline_count = sum(float(r["value"][1]) for r in baseline_metrics)
-            except TimeoutError:
-                baseline_count = 0
+            baseline_count = await _baseline_sum(observability_validator, metric_name)
             
             # Make request
             response = await service_client.predict(
@@ -139,44 +180,64 @@ class TestObservabilityIntegration:
                 f"Multi-service test for {service_name}",
                 service_config["default_model"]
             )
-            assert response.status_code == 200
+            return service_name, baseline_count, response
+        
+        async def _validate(service_name, baseline_count):
+            service_config = service_configs[service_name]
+            metric_name = service_config["expected_metrics"][0]
             
-            service_results[service_name] = {
-                "baseline_count": baseline_count,
-                "service_config": service_config,
-                "response": response
-            }
-        
-        # Wait for observability data
-        await asyncio.sleep(5)
-        
-        # Validate each service has observability data
-        for service_name, result in service_results.items():
-            service_config = result["service_config"]
-            baseline_count = result["baseline_count"]
+            # Metrics, traces and logs are independent, so query them together
+            metrics, traces, logs = await asyncio.gather(
+                _poll_until(
+                    lambda: _metric_incremented(
+                        observability_validator, metric_name, baseline_count
+                    ),
+                    timeout=30,
+                ),
+                observability_validator.validate_traces(
+                    service_config["name"], timeout=20
+                ),
+                observability_validator.validate_logs(
+                    service_config["name"], timeout=20
+                ),
+                return_exceptions=True,
+            )
             
             # Check metrics
-            metric_name = service_config["expected_metrics"][0]
-            metrics = await observability_validator.wait_for_metrics(metric_name)
-            new_count = sum(float(r["value"][1]) for r in metrics)
-            assert new_count > baseline_count, f"No metric increment for {service_name}"
+            if isinstance(metrics, BaseException):
+                raise metrics
+            assert metrics is not None, f"No metric increment for {service_name}"
             
             # Check traces
-            traces = await observability_validator.validate_traces(
-                service_config["name"],
-                timeout=20
-            )
+            if isinstance(traces, BaseException):
+                raise traces
             assert len(traces) > 0, f"No traces found for {service_name}"
             
             # Check logs
-            try:
-                logs = await observability_validator.validate_logs(
-                    service_config["name"],
-                    timeout=20
-                )
-                assert len(logs) > 0, f"No logs found for {service_name}"
-            except TimeoutError:
+            if isinstance(logs, TimeoutError):
                 print(f"Warning: Logs not found for {service_name} (may be expected)")
+            elif isinstance(logs, BaseException):
+                raise logs
+            else:
+                assert len(logs) > 0, f"No logs found for {service_name}"
+        
+        # Generate requests across all available services concurrently
+        service_results = {}
+        for service_name, baseline_count, response in await asyncio.gather(
+            *(_baseline_and_predict(s) for s in available_services)
+        ):
+            assert response.status_code == 200
+            service_results[service_name] = baseline_count
+        
+        # Validate each service has observability data; report the first
+        # failure in service order, as the sequential version did
+        outcomes = await asyncio.gather(
+            *(_validate(name, baseline) for name, baseline in service_results.items()),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
         
         print(f"✅ Multi-service observability validated for {len(available_services)} services")
 
@@ -198,15 +259,20 @@ class TestObservabilityIntegration:
         
         service_config = service_configs[service_name]
         
-        # Get baseline error metrics
+        # Get baseline error metrics for every error outcome in one query
         metric_name = service_config["expected_metrics"][0]
+        error_query = (
+            f'sum by (outcome) ({metric_name}{{outcome=~"error|timeout|http_error"}})'
+        )
+        
+        async def _errors_by_outcome():
+            result = await observability_validator.prom_query(error_query)
+            return {r["metric"]["outcome"]: float(r["value"][1]) for r in result}
+        
         try:
-            error_metrics = await observability_validator.wait_for_metrics(
-                metric_name, labels={"outcome": "http_error"}, timeout=5
-            )
-            baseline_errors = sum(float(r["value"][1]) for r in error_metrics)
-        except TimeoutError:
-            baseline_errors = 0
+            baseline_errors_for = await _errors_by_outcome()
+        except Exception:
+            baseline_errors_for = {}
         
         # Make request that should trigger error handling
         response = await service_client.make_request(
@@ -219,57 +285,86 @@ class TestObservabilityIntegration:
         # Should still return 200 with fallback
         assert response.status_code == 200
         
-        await asyncio.sleep(3)
-        
         # Check if error metrics were generated
-        error_outcomes = ["error", "timeout", "http_error"]
-        error_metric_found = False
+        async def _new_error_outcomes():
+            try:
+                current = await _errors_by_outcome()
+            except Exception as e:
+                print(f"Metrics query failed: {e}")
+                return None
+            return [
+                outcome for outcome, count in current.items()
+                if count > baseline_errors_for.get(outcome, 0)
+            ]
+        
+        async def _check_metrics():
+            new_outcomes = await _poll_until(_new_error_outcomes, timeout=10)
+            if new_outcomes:
+                print(f"Found error metric with outcome: {', '.join(new_outcomes)}")
+            return bool(new_outcomes)
         
-        for outcome in error_outcomes:
+        # Check traces for error indicators
+        async def _check_traces():
             try:
-                result = await observability_validator.wait_for_metrics(
-                    metric_name, labels={"outcome": outcome}, timeout=10
+                traces = await observability_validator.validate_traces(
+                    service_config["name"],
+                    timeout=30
                 )
-                if result:
-                    error_metric_found = True
-                    print(f"Found error metric with outcome: {outcome}")
-                    break
             except TimeoutError:
-                continue
-        
-        # Check traces for error indicators
-        traces = await observability_validator.validate_traces(
-            service_config["name"],
-            timeout=30
-        )
-        
-        error_trace_found = False
-        for trace in traces:
-            for span in trace["spans"]:
-                span_tags = {tag["key"]: tag["value"] for tag in span.get("tags", [])}
-                if (span_tags.get("correlation_id") == correlation_id and 
-                    (span_tags.get("error") == "true" or 
-                     "error" in span.get("operationName", "").lower())):
-                    error_trace_found = True
-                    break
+                return False
+            error_trace, _ = _find_trace_with(
+                traces,
+                lambda span: (
+                    _span_has_tag(span, "correlation_id", correlation_id)
+                    and (
+                        _span_has_tag(span, "error", "true")
+                        or "error" in span.get("operationName", "").lower()
+                    )
+                ),
+            )
+            return error_trace is not None
         
         # Check logs for error messages
-        logs = await observability_validator.validate_logs(
-            service_config["name"],
-            timeout=30
-        )
+        async def _check_logs():
+            try:
+                logs = await observability_validator.validate_logs(
+                    service_config["name"],
+                    timeout=30
+                )
+            except TimeoutError:
+                return False
+            return any(
+                correlation_id in log_message and _ERR_RE.search(log_message)
+                for log_stream in logs
+                for _, log_message in log_stream.get("values", ())
+            )
         
-        error_log_found = False
-        for log_stream in logs:
-            for log_entry in log_stream.get("values", []):
-                timestamp, log_message = log_entry
-                
-                if (correlation_id in log_message and 
-                    ("ERROR" in log_message.upper() or 
-                     "error" in log_message.lower() or
-                     "fallback" in log_message.lower())):
-                    error_log_found = True
-                    break
+        # Any one pillar is enough, so race the checks and stop at the first hit
+        checks = {
+            "metrics": asyncio.create_task(_check_metrics()),
+            "traces": asyncio.create_task(_check_traces()),
+            "logs": asyncio.create_task(_check_logs()),
+        }
+        found = dict.fromkeys(checks, False)
+        pending = set(checks.values())
+        deadline = time.monotonic() + 30
+        while pending and not any(found.values()):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for name, task in checks.items():
+                if task in done and task.exception() is None:
+                    found[name] = task.result()
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        error_metric_found = found["metrics"]
+        error_trace_found = found["traces"]
+        error_log_found = found["logs"]
         
         # Print results for debugging
         print(f"Error observability results:")
@@ -297,41 +392,40 @@ class TestObservabilityIntegration:
         if not service_config:
             pytest.skip(f"Service {service_name} not configured")
         
-        # Warm up
-        for _ in range(3):
-            response = await service_client.predict(
-                service_name,
-                "Warmup request",
-                service_config["default_model"]
-            )
-            assert response.status_code == 200
+        default_model = service_config["default_model"]
+        
+        # Warm up concurrently; this also fills the connection pool
+        warmups = await asyncio.gather(*(
+            service_client.predict(service_name, "Warmup request", default_model)
+            for _ in range(3)
+        ))
+        assert all(r.status_code == 200 for r in warmups)
         
-        # Measure latency with observability
-        latencies = []
+        # Measure latency with observability (sequential, one request at a time)
+        service_latencies = array("d")
+        client_latencies = array("d")
         for i in range(10):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             response = await service_client.predict(
                 service_name,
                 f"Performance test {i}",
-                service_config["default_model"]
+                default_model
             )
-            end_time = time.time()
+            end_ns = time.perf_counter_ns()
             
             assert response.status_code == 200
             
             # Get reported latency from service
             response_data = response.json()
             service_latency = response_data.get("latency_ms", 0)
-            client_latency = (end_time - start_time) * 1000
+            client_latency = (end_ns - start_ns) / 1e6
             
-            latencies.append({
-                "service": service_latency,
-                "client": client_latency
-            })
+            service_latencies.append(service_latency)
+            client_latencies.append(client_latency)
         
         # Validate reasonable performance
-        avg_service_latency = sum(l["service"] for l in latencies) / len(latencies)
-        avg_client_latency = sum(l["client"] for l in latencies) / len(latencies)
+        avg_service_latency = fmean(service_latencies)
+        avg_client_latency = fmean(client_latencies)
         
         # Reasonable thresholds (adjust based on your requirements)
         assert avg_service_latency < 1000, f"Average service latency {avg_service_latency}ms too high"
@@ -354,42 +448,48 @@ class TestDashboardIntegration:
     async def test_grafana_datasource_connectivity(
         self,
         test_config,
+        http_client,
         observability_stack_health,
         cleanup_test_data
     ):
         """Test that Grafana can connect to all datasources."""
-        import httpx
-        
         grafana_url = test_config["grafana_url"]
         
         # Test datasource health endpoints
         datasources = ["prometheus", "loki", "jaeger"]
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            for ds_uid in datasources:
-                try:
-                    response = await client.get(
-                        f"{grafana_url}/api/datasources/uid/{ds_uid}/health",
-                        auth=("admin", "admin")
-                    )
+        async def _probe(ds_uid):
+            return await http_client.get(
+                f"{grafana_url}/api/datasources/uid/{ds_uid}/health",
+                auth=("admin", "admin")
+            )
+        
+        # Probe every datasource at once over the shared pooled client
+        responses = await asyncio.gather(
+            *(_probe(ds_uid) for ds_uid in datasources), return_exceptions=True
+        )
+        
+        for ds_uid, response in zip(datasources, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                
+                if response.status_code == 200:
+                    health_data = response.json()
+                    assert health_data.get("status") in ["OK", "success"], \
+                        f"Datasource {ds_uid} unhealthy: {health_data}"
+                    print(f"✅ Datasource {ds_uid}: {health_data.get('status', 'OK')}")
+                else:
+                    print(f"⚠️ Datasource {ds_uid} health check failed: {response.status_code}")
                     
-                    if response.status_code == 200:
-                        health_data = response.json()
-                        assert health_data.get("status") in ["OK", "success"], \
-                            f"Datasource {ds_uid} unhealthy: {health_data}"
-                        print(f"✅ Datasource {ds_uid}: {health_data.get('status', 'OK')}")
-                    else:
-                        print(f"⚠️ Datasource {ds_uid} health check failed: {response.status_code}")
-                        
-                except Exception as e:
-                    print(f"⚠️ Datasource {ds_uid} health check error: {e}")
+            except Exception as e:
+                print(f"⚠️ Datasource {ds_uid} health check error: {e}")
 
     @pytest.mark.asyncio
     async def test_dashboard_query_validation(
         self,
         service_client,
         observability_validator,
-        prometheus_client,
         test_config,
         service_configs,
         cleanup_test_data
@@ -401,20 +501,34 @@ class TestDashboardIntegration:
         if not service_config:
             pytest.skip(f"Service {service_name} not configured")
         
+        metric_name = service_config["expected_metrics"][0]
+        latency_metric = service_config["expected_metrics"][1]
+        
+        try:
+            baseline_count = await _metric_sum(observability_validator, metric_name)
+        except Exception:
+            baseline_count = 0
+        
         # Generate some data for dashboard queries
+        default_model = service_config["default_model"]
         for i in range(5):
             response = await service_client.predict(
                 service_name,
                 f"Dashboard query test {i}",
-                service_config["default_model"]
+                default_model
             )
             assert response.status_code == 200
         
-        await asyncio.sleep(5)
+        # Wait until Prometheus has scraped the new requests
+        new_count = await _poll_until(
+            lambda: _metric_incremented(
+                observability_validator, metric_name, baseline_count
+            ),
+            timeout=30,
+        )
+        assert new_count is not None, "Metrics did not increment"
         
         # Test key dashboard queries
-        metric_name = service_config["expected_metrics"][0]
-        latency_metric = service_config["expected_metrics"][1]
         
         dashboard_queries = [
             # Request rate query
@@ -427,10 +541,17 @@ class TestDashboardIntegration:
             f"sum by (variant) (rate({metric_name}[1m]))",
         ]
         
+        # Dispatch every query at once; failures come back as exceptions
+        results = await asyncio.gather(
+            *(observability_validator.prom_query(q) for q in dashboard_queries),
+            return_exceptions=True,
+        )
+        
         query_results = {}
-        for i, query in enumerate(dashboard_queries):
+        for i, (query, result) in enumerate(zip(dashboard_queries, results)):
             try:
-                result = prometheus_client.custom_query(query)
+                if isinstance(result, Exception):
+                    raise result
                 query_results[f"query_{i}"] = {
                     "query": query,
                     "success": True,
@@ -465,7 +586,7 @@ class TestDashboardIntegration:
     @pytest.mark.asyncio
     async def test_alert_rule_validation(
         self,
-        prometheus_client,
+        http_client,
         service_configs,
         test_config,
         cleanup_test_data
@@ -473,46 +594,43 @@ class TestDashboardIntegration:
         """Test that Prometheus alert rules are properly configured."""
         try:
             # Query Prometheus rules API
-            import httpx
+            response = await http_client.get(f"{test_config['prometheus_url']}/api/v1/rules")
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{test_config['prometheus_url']}/api/v1/rules")
+            if response.status_code == 200:
+                rules_data = response.json()
                 
-                if response.status_code == 200:
-                    rules_data = response.json()
+                if rules_data.get("status") == "success":
+                    rule_groups = rules_data.get("data", {}).get("groups", [])
                     
-                    if rules_data.get("status") == "success":
-                        rule_groups = rules_data.get("data", {}).get("groups", [])
-                        
-                        total_rules = 0
-                        total_alerts = 0
-                        
-                        for group in rule_groups:
-                            rules = group.get("rules", [])
-                            total_rules += len(rules)
-                            
-                            for rule in rules:
-                                if rule.get("type") == "alerting":
-                                    total_alerts += 1
-                                    
-                                    # Validate rule structure
-                                    assert "name" in rule, "Alert rule missing name"
-                                    assert "query" in rule, "Alert rule missing query"
-                                    assert "labels" in rule, "Alert rule missing labels"
-                        
-                        print(f"Alert rules validation: {total_alerts} alerts in {len(rule_groups)} groups")
-                        print(f"Total rules: {total_rules}")
+                    total_rules = 0
+                    total_alerts = 0
+                    
+                    for group in rule_groups:
+                        rules = group.get("rules", [])
+                        total_rules += len(rules)
                         
-                        # Should have at least some alerting rules
-                        if total_alerts == 0:
-                            print("⚠️ No alerting rules found")
-                        else:
-                            print(f"✅ Found {total_alerts} alerting rules")
+                        for rule in rules:
+                            if rule.get("type") == "alerting":
+                                total_alerts += 1
+                                
+                                # Validate rule structure
+                                assert "name" in rule, "Alert rule missing name"
+                                assert "query" in rule, "Alert rule missing query"
+                                assert "labels" in rule, "Alert rule missing labels"
+                    
+                    print(f"Alert rules validation: {total_alerts} alerts in {len(rule_groups)} groups")
+                    print(f"Total rules: {total_rules}")
+                    
+                    # Should have at least some alerting rules
+                    if total_alerts == 0:
+                        print("⚠️ No alerting rules found")
                     else:
-                        print(f"⚠️ Prometheus rules query failed: {rules_data}")
+                        print(f"✅ Found {total_alerts} alerting rules")
                 else:
-                    print(f"⚠️ Prometheus rules API returned {response.status_code}")
-                    
+                    print(f"⚠️ Prometheus rules query failed: {rules_data}")
+            else:
+                print(f"⚠️ Prometheus rules API returned {response.status_code}")
+                
         except Exception as e:
             print(f"⚠️ Alert rule validation failed: {e}")
             # Don't fail the test since alerting rules might not be configured
@@ -587,36 +705,29 @@ class TestObservabilityHealth:
         )
         assert response.status_code == 200
         
-        await asyncio.sleep(2)
-        
-        # Check data exists in different systems
-        data_sources = {}
-        
-        # Check metrics retention
-        try:
-            metric_name = service_config["expected_metrics"][0]
-            metrics = await observability_validator.wait_for_metrics(metric_name, timeout=10)
-            data_sources["metrics"] = len(metrics) > 0
-        except TimeoutError:
-            data_sources["metrics"] = False
+        # Check data exists in different systems; the three probes are
+        # independent, so run them concurrently
+        async def _safe(coro):
+            try:
+                return await coro
+            except TimeoutError:
+                return None
         
-        # Check trace retention
-        try:
-            traces = await observability_validator.validate_traces(
+        metric_name = service_config["expected_metrics"][0]
+        metrics, traces, logs = await asyncio.gather(
+            _safe(observability_validator.wait_for_metrics(metric_name, timeout=10)),
+            _safe(observability_validator.validate_traces(
                 service_config["name"], timeout=10
-            )
-            data_sources["traces"] = len(traces) > 0
-        except TimeoutError:
-            data_sources["traces"] = False
-        
-        # Check log retention
-        try:
-            logs = await observability_validator.validate_logs(
+            )),
+            _safe(observability_validator.validate_logs(
                 service_config["name"], timeout=10
-            )
-            data_sources["logs"] = len(logs) > 0
-        except TimeoutError:
-            data_sources["logs"] = False
+            )),
+        )
+        data_sources = {
+            "metrics": bool(metrics),
+            "traces": bool(traces),
+            "logs": bool(logs),
+        }
         
         # Report retention status
         retained_sources = [k for k, v in data_sources.items() if v]
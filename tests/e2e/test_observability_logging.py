@@ -5,10 +5,44 @@ Tests verify that logs are properly formatted, aggregated, and
 correlated with traces and metrics across services.
 """
 import asyncio
-import json
+import orjson
 import pytest
+import re
 import time
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+# Loki returns log lines as str; orjson parses those directly
+_loads = orjson.loads
+_JSONDecodeError = orjson.JSONDecodeError
+
+
+def _get_fields(log_message: str, keys) -> Optional[Dict[str, Any]]:
+    """Decode a JSON log line and return the requested top-level fields.
+
+    Callers prefilter lines cheaply before calling this. Returns None when the
+    line is not valid JSON; missing keys map to None.
+    """
+    try:
+        log_data = _loads(log_message)
+    except _JSONDecodeError:
+        return None
+    return {key: log_data.get(key) for key in keys}
+
+
+def _log_messages(logs):
+    """Yield raw log lines from Loki streams, lazily."""
+    for log_stream in logs:
+        for _, log_message in log_stream.get("values", []):
+            yield log_message
+
+
+def _json_levels(logs):
+    """Yield the level of each JSON log line, or "UNKNOWN" when absent."""
+    for log_message in _log_messages(logs):
+        if log_message.startswith("{"):
+            fields = _get_fields(log_message, ("levelname",))
+            if fields is not None:
+                yield fields["levelname"] or "UNKNOWN"
 
 
 class TestLogGeneration:
@@ -52,12 +86,13 @@ class TestLogGeneration:
                 for log_entry in log_stream.get("values", []):
                     timestamp, log_message = log_entry
                     
-                    # Skip non-JSON logs (might be uvicorn access logs)
-                    if not log_message.strip().startswith("{"):
+                    # Skip non-JSON logs (might be uvicorn access logs); Loki
+                    # lines are already trimmed, so no strip() copy is needed
+                    if not log_message.startswith("{"):
                         continue
                     
                     try:
-                        log_data = json.loads(log_message)
+                        log_data = _loads(log_message)
                         
                         # Validate required JSON log fields
                         assert "asctime" in log_data, "Missing asctime field"
@@ -78,7 +113,7 @@ class TestLogGeneration:
                             assert True  # Found our correlation ID
                             break
                             
-                    except json.JSONDecodeError as e:
+                    except _JSONDecodeError as e:
                         pytest.fail(f"Invalid JSON in log message: {log_message[:100]}... Error: {e}")
 
     @pytest.mark.asyncio
@@ -117,26 +152,17 @@ class TestLogGeneration:
             timeout=30
         )
         
-        # Collect log levels from JSON logs
-        found_levels = set()
-        for log_stream in logs:
-            for log_entry in log_stream.get("values", []):
-                timestamp, log_message = log_entry
-                
-                if log_message.strip().startswith("{"):
-                    try:
-                        log_data = json.loads(log_message)
-                        found_levels.add(log_data.get("levelname", "UNKNOWN"))
-                    except json.JSONDecodeError:
-                        continue
+        # Should have at least INFO level logs; stops at the first one
+        assert any(level == "INFO" for level in _json_levels(logs)), \
+            "No INFO level logs found"
         
-        # Should have at least INFO level logs
-        assert "INFO" in found_levels, "No INFO level logs found"
-        
-        # Validate log levels are standard Python levels
+        # Validate log levels are standard Python levels; stops at the first bad one
         valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        for level in found_levels:
-            assert level in valid_levels, f"Invalid log level: {level}"
+        invalid = next(
+            (level for level in _json_levels(logs) if level not in valid_levels),
+            None
+        )
+        assert invalid is None, f"Invalid log level: {invalid}"
 
     @pytest.mark.asyncio
     async def test_correlation_id_propagation(
@@ -149,51 +175,43 @@ class TestLogGeneration:
         cleanup_test_data
     ):
         """Test that correlation IDs are consistently logged."""
-        # Make multiple requests with the same correlation ID
-        for i in range(3):
-            for service_name in test_config["services"]:
-                if service_name not in service_configs:
-                    continue
-                
-                service_config = service_configs[service_name]
-                
-                response = await service_client.predict(
-                    service_name,
-                    f"Correlation ID test {i}",
-                    service_config["default_model"]
-                )
-                assert response.status_code == 200
-        
-        # Validate logs contain correct correlation ID
-        for service_name in test_config["services"]:
-            if service_name not in service_configs:
-                continue
-            
-            service_config = service_configs[service_name]
-            
-            logs = await observability_validator.validate_logs(
-                service_config["name"],
-                timeout=30
+        active_services = [s for s in test_config["services"] if s in service_configs]
+        
+        # Make multiple requests with the same correlation ID, all at once
+        responses = await asyncio.gather(*(
+            service_client.predict(
+                service_name,
+                f"Correlation ID test {i}",
+                service_configs[service_name]["default_model"]
             )
+            for i in range(3)
+            for service_name in active_services
+        ))
+        assert all(r.status_code == 200 for r in responses)
+        
+        # Validate logs contain correct correlation ID; one Loki query covers
+        # every service
+        all_logs = await observability_validator.validate_logs_multi(
+            [service_configs[s]["name"] for s in active_services],
+            timeout=30
+        )
+        
+        for service_name in active_services:
+            logs = all_logs[service_configs[service_name]["name"]]
             
-            correlation_found = False
-            for log_stream in logs:
-                for log_entry in log_stream.get("values", []):
-                    timestamp, log_message = log_entry
-                    
-                    if correlation_id in log_message:
-                        correlation_found = True
-                        
-                        # If it's JSON, validate the correlation_id field
-                        if log_message.strip().startswith("{"):
-                            try:
-                                log_data = json.loads(log_message)
-                                assert log_data.get("correlation_id") == correlation_id, \
-                                    "Correlation ID mismatch in JSON log"
-                            except json.JSONDecodeError:
-                                pass  # Non-JSON log with correlation ID is also valid
-            
+            correlation_found = any(
+                correlation_id in log_message for log_message in _log_messages(logs)
+            )
             assert correlation_found, f"Correlation ID {correlation_id} not found in logs for {service_name}"
+            
+            # JSON lines mentioning the ID must carry it in the correlation_id field
+            for log_message in _log_messages(logs):
+                if correlation_id in log_message and log_message.startswith("{"):
+                    fields = _get_fields(log_message, ("correlation_id",))
+                    if fields is None:
+                        continue  # Non-JSON log with correlation ID is also valid
+                    assert fields["correlation_id"] == correlation_id, \
+                        "Correlation ID mismatch in JSON log"
 
     @pytest.mark.asyncio
     async def test_trace_log_correlation(
@@ -246,22 +264,19 @@ class TestLogGeneration:
             for log_entry in log_stream.get("values", []):
                 timestamp, log_message = log_entry
                 
-                if correlation_id in log_message and log_message.strip().startswith("{"):
-                    try:
-                        log_data = json.loads(log_message)
-                        log_trace_id = log_data.get("trace_id")
-                        
-                        if log_trace_id:
-                            # Trace IDs might be in different formats, check if any match
-                            for trace_id in trace_ids:
-                                if log_trace_id in trace_id or trace_id in log_trace_id:
-                                    trace_in_logs = True
-                                    break
-                        
-                        if trace_in_logs:
-                            break
-                    except json.JSONDecodeError:
-                        continue
+                if correlation_id in log_message and log_message.startswith("{"):
+                    fields = _get_fields(log_message, ("trace_id",))
+                    log_trace_id = fields and fields["trace_id"]
+                    
+                    if log_trace_id:
+                        # Trace IDs might be in different formats, check if any match
+                        for trace_id in trace_ids:
+                            if log_trace_id in trace_id or trace_id in log_trace_id:
+                                trace_in_logs = True
+                                break
+                    
+                    if trace_in_logs:
+                        break
             
             if trace_in_logs:
                 break
@@ -366,13 +381,12 @@ class TestLogAggregation:
                 timestamp, log_message = log_entry
                 
                 # Try to extract level from JSON logs
-                if log_message.strip().startswith("{"):
-                    try:
-                        log_data = json.loads(log_message)
-                        level = log_data.get("levelname", "UNKNOWN")
-                        level_counts[level] = level_counts.get(level, 0) + 1
-                    except json.JSONDecodeError:
+                if log_message.startswith("{"):
+                    fields = _get_fields(log_message, ("levelname",))
+                    if fields is None:
                         continue
+                    level = fields["levelname"] or "UNKNOWN"
+                    level_counts[level] = level_counts.get(level, 0) + 1
                 else:
                     # For non-JSON logs, try to detect level in message
                     for level in ["ERROR", "WARNING", "INFO", "DEBUG"]:
@@ -403,15 +417,16 @@ class TestLogAggregation:
         # Record start time
         start_time = time.time()
         
-        # Generate timestamped logs
-        for i in range(3):
-            response = await service_client.predict(
+        # Generate timestamped logs; order doesn't matter, only the window
+        responses = await asyncio.gather(*(
+            service_client.predict(
                 service_name,
                 f"Time range test {i} at {int(start_time)}",
                 service_config["default_model"]
             )
-            assert response.status_code == 200
-            await asyncio.sleep(1)
+            for i in range(3)
+        ))
+        assert all(r.status_code == 200 for r in responses)
         
         # Get logs (should include our test logs)
         logs = await observability_validator.validate_logs(
@@ -457,14 +472,15 @@ class TestLogQueries:
         
         # Generate consistent log volume
         log_count = 5
-        for i in range(log_count):
-            response = await service_client.predict(
+        responses = await asyncio.gather(*(
+            service_client.predict(
                 service_name,
                 f"Log rate test message {i}",
                 service_config["default_model"]
             )
-            assert response.status_code == 200
-            await asyncio.sleep(0.5)  # Spread over time
+            for i in range(log_count)
+        ))
+        assert all(r.status_code == 200 for r in responses)
         
         # Get logs to validate they were generated
         logs = await observability_validator.validate_logs(
@@ -503,13 +519,11 @@ class TestLogQueries:
             "Normal log without pattern"
         ]
         
-        for pattern in test_patterns:
-            response = await service_client.predict(
-                service_name,
-                pattern,
-                service_config["default_model"]
-            )
-            assert response.status_code == 200
+        responses = await asyncio.gather(*(
+            service_client.predict(service_name, pattern, service_config["default_model"])
+            for pattern in test_patterns
+        ))
+        assert all(r.status_code == 200 for r in responses)
         
         # Get logs and validate pattern presence
         logs = await observability_validator.validate_logs(
@@ -517,14 +531,14 @@ class TestLogQueries:
             timeout=30
         )
         
+        # One scan per line for all patterns; stop once every pattern has been seen
+        expected_patterns = {"PATTERN_SUCCESS", "PATTERN_ERROR"}
+        pattern_re = re.compile("|".join(expected_patterns))
         found_patterns = set()
-        for log_stream in logs:
-            for log_entry in log_stream.get("values", []):
-                timestamp, log_message = log_entry
-                
-                for pattern in ["PATTERN_SUCCESS", "PATTERN_ERROR"]:
-                    if pattern in log_message:
-                        found_patterns.add(pattern)
+        for log_message in _log_messages(logs):
+            found_patterns.update(pattern_re.findall(log_message))
+            if found_patterns == expected_patterns:
+                break
         
         # Should find at least one pattern (depending on log processing)
         print(f"Found patterns in logs: {found_patterns}")
@@ -541,45 +555,34 @@ class TestLogQueries:
     ):
         """Test querying logs by correlation ID."""
         # Make requests across multiple services with same correlation ID
-        services_used = []
-        for service_name in test_config["services"]:
-            if service_name not in service_configs:
-                continue
-            
-            service_config = service_configs[service_name]
-            services_used.append(service_name)
-            
-            response = await service_client.predict(
+        services_used = [s for s in test_config["services"] if s in service_configs]
+        responses = await asyncio.gather(*(
+            service_client.predict(
                 service_name,
                 f"Cross-service correlation test for {service_name}",
-                service_config["default_model"]
+                service_configs[service_name]["default_model"]
             )
-            assert response.status_code == 200
+            for service_name in services_used
+        ))
+        assert all(r.status_code == 200 for r in responses)
+        
+        # Get logs for every service in one query and validate correlation ID presence
+        try:
+            all_logs = await observability_validator.validate_logs_multi(
+                [service_configs[s]["name"] for s in services_used],
+                timeout=20
+            )
+        except TimeoutError:
+            all_logs = {}
         
-        # Get logs for each service and validate correlation ID presence
-        correlation_found = False
         for service_name in services_used:
-            service_config = service_configs[service_name]
-            
-            try:
-                logs = await observability_validator.validate_logs(
-                    service_config["name"],
-                    timeout=20
-                )
-                
-                for log_stream in logs:
-                    for log_entry in log_stream.get("values", []):
-                        timestamp, log_message = log_entry
-                        
-                        if correlation_id in log_message:
-                            correlation_found = True
-                            break
-                    
-                    if correlation_found:
-                        break
-                        
-            except TimeoutError:
+            if not all_logs.get(service_configs[service_name]["name"]):
                 print(f"Warning: Timeout getting logs for {service_name}")
-                continue
+        
+        correlation_found = any(
+            correlation_id in log_message
+            for logs in all_logs.values()
+            for log_message in _log_messages(logs)
+        )
         
         assert correlation_found, f"Correlation ID {correlation_id} not found in any service logs"
@@ -250,7 +250,6 @@ class TestMetricsQueries:
         self,
         service_client,
         observability_validator,
-        prometheus_client,
         service_configs,
         test_config,
         cleanup_test_data
@@ -279,7 +278,7 @@ class TestMetricsQueries:
         rate_query = f"sum(rate({metric_name}[1m]))"
         
         try:
-            result = prometheus_client.custom_query(rate_query)
+            result = await observability_validator.prom_query(rate_query)
             assert len(result) > 0, "No rate query results"
             
             rate_value = float(result[0]["value"][1])
@@ -293,7 +292,6 @@ class TestMetricsQueries:
         self,
         service_client,
         observability_validator,
-        prometheus_client,
         service_configs,
         test_config,
         cleanup_test_data
@@ -324,7 +322,7 @@ class TestMetricsQueries:
             quantile_query = f"histogram_quantile({p}, sum by (le) (rate({latency_metric}_bucket[5m])))"
             
             try:
-                result = prometheus_client.custom_query(quantile_query)
+                result = await observability_validator.prom_query(quantile_query)
                 if result:  # May be empty if not enough data
                     latency_value = float(result[0]["value"][1])
                     assert latency_value >= 0, f"P{int(p*100)} latency should be non-negative"
@@ -339,7 +337,7 @@ class TestMetricsQueries:
     @pytest.mark.asyncio
     async def test_error_rate_calculation(
         self,
-        prometheus_client,
+        observability_validator,
         service_configs,
         test_config,
         cleanup_test_data
@@ -363,7 +361,7 @@ class TestMetricsQueries:
         '''
         
         try:
-            result = prometheus_client.custom_query(error_rate_query)
+            result = await observability_validator.prom_query(error_rate_query)
             
             if result:
                 error_rate = float(result[0]["value"][1])
@@ -1,5 +1,7 @@
 """Tests for canary routing logic in the inference gateway."""
 
+import hashlib
+import random
 from unittest.mock import MagicMock
 
 import httpx
@@ -8,7 +10,15 @@ import respx
 from fastapi.testclient import TestClient
 
 # Import the app
-from services.inference.app.main import _choose_variant, _parse_percent, app
+from services.inference.app.main import (
+    DEFAULT_LATENCY_BUCKETS,
+    GatewayConfig,
+    _choose_variant,
+    _parse_buckets,
+    _parse_percent,
+    _sticky_bucket,
+    app,
+)
 
 
 class TestPercentParsing:
@@ -34,6 +44,51 @@ class TestPercentParsing:
         assert _parse_percent(None, 0.5) == 0.5
 
 
+class TestBucketParsing:
+    """Test the latency histogram bucket parsing utility."""
+
+    def test_parse_buckets(self):
+        assert _parse_buckets("0.5, 0.1,1") == (0.1, 0.5, 1.0)
+
+    def test_parse_buckets_invalid(self):
+        assert _parse_buckets(None) == DEFAULT_LATENCY_BUCKETS
+        assert _parse_buckets("") == DEFAULT_LATENCY_BUCKETS
+        assert _parse_buckets("fast,slow") == DEFAULT_LATENCY_BUCKETS
+
+
+class TestGatewayConfig:
+    """Test values derived once when the gateway config is built."""
+
+    def test_derived_fields(self):
+        cfg = GatewayConfig(
+            ts_url_default="http://ts:8080",
+            model_name_baseline="model",
+            model_version_baseline="1.0",
+            canary_percent=0.25,
+        )
+        assert cfg.url_baseline == "http://ts:8080/predictions/model/1.0"
+        assert cfg.url_candidate == "http://localhost:8080/predictions/custom-text"
+        assert cfg.threshold == 2500
+
+    def test_long_salt_fits_blake2b_key(self):
+        request = MagicMock()
+        request.headers.get.side_effect = lambda h: (
+            "user123" if h == "X-User-Id" else None
+        )
+        cfg = GatewayConfig(canary_percent=0.5, salt="s" * 100, sticky_hash="blake2b")
+        assert len(cfg.salt_bytes) <= 64
+        assert _choose_variant(request.headers, cfg) in ("baseline", "candidate")
+
+    def test_unknown_sticky_hash(self):
+        with pytest.raises(ValueError):
+            GatewayConfig(sticky_hash="md5")
+
+    def test_sha256_matches_original_bucketing(self):
+        digest = hashlib.sha256(b"salt:user123").digest()
+        expected = int.from_bytes(digest[:2], "big") % 10000
+        assert _sticky_bucket("sha256", b"salt", "user123") == expected
+
+
 class TestCanaryRouting:
     """Test the canary variant selection logic."""
 
@@ -43,7 +98,8 @@ class TestCanaryRouting:
         request.headers.get.side_effect = lambda h: (
             "candidate" if h == "X-Canary" else None
         )
-        assert _choose_variant(request, 0.0, "X-User-Id", "salt") == "candidate"
+        cfg = GatewayConfig(canary_percent=0.0, salt="salt")
+        assert _choose_variant(request.headers, cfg) == "candidate"
 
     def test_force_header_baseline(self):
         """Test forcing baseline variant via header."""
@@ -51,7 +107,20 @@ class TestCanaryRouting:
         request.headers.get.side_effect = lambda h: (
             "baseline" if h == "X-Canary" else None
         )
-        assert _choose_variant(request, 1.0, "X-User-Id", "salt") == "baseline"
+        cfg = GatewayConfig(canary_percent=1.0, salt="salt")
+        assert _choose_variant(request.headers, cfg) == "baseline"
+
+    def test_canary_off_ignores_sticky_header(self):
+        """Test that 0%/100% canary never consults the sticky header."""
+        request = MagicMock()
+        request.headers.get.side_effect = lambda h: (
+            "user123" if h == "X-User-Id" else None
+        )
+        off, on = GatewayConfig(canary_percent=0.0), GatewayConfig(canary_percent=1.0)
+        assert _choose_variant(request.headers, off) == "baseline"
+        assert _choose_variant(request.headers, on) == "candidate"
+        looked_up = [c.args[0] for c in request.headers.get.call_args_list]
+        assert "X-User-Id" not in looked_up
 
     def test_sticky_routing_deterministic(self):
         """Test that sticky routing is deterministic for the same user."""
@@ -61,22 +130,23 @@ class TestCanaryRouting:
         )
 
         # Same user should always get same variant
-        results = [
-            _choose_variant(request, 0.5, "X-User-Id", "salt") for _ in range(10)
-        ]
+        cfg = GatewayConfig(canary_percent=0.5, salt="salt")
+        results = [_choose_variant(request.headers, cfg) for _ in range(10)]
         assert len(set(results)) == 1
 
-    def test_sticky_routing_distribution(self):
+    @pytest.mark.parametrize("sticky_hash", ["xxh3", "blake2b", "sha256"])
+    def test_sticky_routing_distribution(self, sticky_hash):
         """Test that sticky routing distributes users roughly per canary percentage."""
         baseline_count = 0
         candidate_count = 0
+        cfg = GatewayConfig(canary_percent=0.3, salt="salt", sticky_hash=sticky_hash)
 
         for i in range(1000):
             request = MagicMock()
             request.headers.get.side_effect = lambda h: (
                 f"user{i}" if h == "X-User-Id" else None
             )
-            variant = _choose_variant(request, 0.3, "X-User-Id", "salt")
+            variant = _choose_variant(request.headers, cfg)
             if variant == "candidate":
                 candidate_count += 1
             else:
@@ -93,17 +163,30 @@ class TestCanaryRouting:
         request.headers.get.return_value = None
 
         # With 0% canary, should always be baseline
-        results = [
-            _choose_variant(request, 0.0, "X-User-Id", "salt") for _ in range(10)
-        ]
+        cfg = GatewayConfig(canary_percent=0.0, salt="salt")
+        results = [_choose_variant(request.headers, cfg) for _ in range(10)]
         assert all(r == "baseline" for r in results)
 
         # With 100% canary, should always be candidate
-        results = [
-            _choose_variant(request, 1.0, "X-User-Id", "salt") for _ in range(10)
-        ]
+        cfg = GatewayConfig(canary_percent=1.0, salt="salt")
+        results = [_choose_variant(request.headers, cfg) for _ in range(10)]
         assert all(r == "candidate" for r in results)
 
+    def test_random_routing_uses_injected_rng(self):
+        """Test that a seeded RNG makes non-sticky routing reproducible."""
+        request = MagicMock()
+        request.headers.get.return_value = None
+        cfg = GatewayConfig(canary_percent=0.5)
+
+        first = [
+            _choose_variant(request.headers, cfg, random.Random(7)) for _ in range(3)
+        ]
+        rng = random.Random(7)
+        draws = [_choose_variant(request.headers, cfg, rng) for _ in range(200)]
+        assert len(set(first)) == 1
+        assert first[0] == draws[0]
+        assert 60 < sum(d == "candidate" for d in draws) < 140
+
 
 @pytest.mark.asyncio
 class TestInferenceEndpoint:
@@ -111,13 +194,12 @@ class TestInferenceEndpoint:
 
     async def test_predict_baseline_routing(self, monkeypatch):
         """Test that baseline routing works correctly."""
-        client = TestClient(app)
         monkeypatch.setenv("TS_URL", "http://torchserve:8080")
         monkeypatch.setenv("MODEL_NAME_BASELINE", "model")
         monkeypatch.setenv("MODEL_VERSION_BASELINE", "1.0")
         monkeypatch.setenv("CANARY_PERCENT", "0")  # All traffic to baseline
 
-        with respx.mock:
+        with TestClient(app) as client, respx.mock:
             route = respx.post("http://torchserve:8080/predictions/model/1.0").mock(
                 return_value=httpx.Response(
                     200,
@@ -136,13 +218,12 @@ class TestInferenceEndpoint:
 
     async def test_predict_candidate_routing(self, monkeypatch):
         """Test that candidate routing works correctly."""
-        client = TestClient(app)
         monkeypatch.setenv("TS_URL", "http://torchserve:8080")
         monkeypatch.setenv("MODEL_NAME_CANDIDATE", "model")
         monkeypatch.setenv("MODEL_VERSION_CANDIDATE", "2.0")
         monkeypatch.setenv("CANARY_PERCENT", "100")  # All traffic to candidate
 
-        with respx.mock:
+        with TestClient(app) as client, respx.mock:
             route = respx.post("http://torchserve:8080/predictions/model/2.0").mock(
                 return_value=httpx.Response(
                     200,
@@ -161,7 +242,6 @@ class TestInferenceEndpoint:
 
     async def test_predict_force_header(self, monkeypatch):
         """Test forcing specific variant via header."""
-        client = TestClient(app)
         monkeypatch.setenv("TS_URL", "http://torchserve:8080")
         monkeypatch.setenv("MODEL_NAME_BASELINE", "model")
         monkeypatch.setenv("MODEL_VERSION_BASELINE", "1.0")
@@ -169,7 +249,7 @@ class TestInferenceEndpoint:
         monkeypatch.setenv("MODEL_VERSION_CANDIDATE", "2.0")
         monkeypatch.setenv("CANARY_PERCENT", "0")  # Default to baseline
 
-        with respx.mock:
+        with TestClient(app) as client, respx.mock:
             candidate_route = respx.post(
                 "http://torchserve:8080/predictions/model/2.0"
             ).mock(
@@ -192,12 +272,11 @@ class TestInferenceEndpoint:
 
     async def test_predict_fallback_on_error(self, monkeypatch):
         """Test fallback to dummy prediction on TorchServe error."""
-        client = TestClient(app)
         monkeypatch.setenv("TS_URL", "http://torchserve:8080")
         monkeypatch.setenv("MODEL_NAME_BASELINE", "model")
         monkeypatch.setenv("MODEL_VERSION_BASELINE", "1.0")
 
-        with respx.mock:
+        with TestClient(app) as client, respx.mock:
             respx.post("http://torchserve:8080/predictions/model/1.0").mock(
                 return_value=httpx.Response(503, text="Service Unavailable")
             )
@@ -216,12 +295,11 @@ class TestInferenceEndpoint:
 
     async def test_predict_timeout_fallback(self, monkeypatch):
         """Test fallback on timeout."""
-        client = TestClient(app)
         monkeypatch.setenv("TS_URL", "http://torchserve:8080")
         monkeypatch.setenv("MODEL_NAME_BASELINE", "model")
         monkeypatch.setenv("TS_TIMEOUT_MS", "100")  # Very short timeout
 
-        with respx.mock:
+        with TestClient(app) as client, respx.mock:
             # Mock a slow response
             respx.post("http://torchserve:8080/predictions/model").mock(
                 side_effect=httpx.TimeoutException("timeout")
@@ -238,20 +316,32 @@ class TestHealthEndpoints:
 
     def test_healthz(self):
         """Test basic health check."""
-        client = TestClient(app)
-        response = client.get("/healthz")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["ok"] is True
-        assert "version" in data
+        with TestClient(app) as client:
+            response = client.get("/healthz")
+            assert response.status_code == 200
+            data = response.json()
+            assert data["ok"] is True
+            assert "version" in data
+
+    def test_metrics(self):
+        """Test metrics exposition, plain and gzip-compressed."""
+        with TestClient(app) as client:
+            plain = client.get("/metrics", headers={"Accept-Encoding": "identity"})
+            assert plain.status_code == 200
+            assert "content-encoding" not in plain.headers
+            assert "seraphim_inference_latency_seconds" in plain.text
+            assert "python_gc_" not in plain.text
+
+            gz = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+            assert gz.headers["content-encoding"] == "gzip"
+            assert "seraphim_inference_requests_total" in gz.text
 
     @pytest.mark.asyncio
     async def test_readyz_healthy(self, monkeypatch):
         """Test readiness when TorchServe is healthy."""
-        client = TestClient(app)
         monkeypatch.setenv("TS_URL", "http://torchserve:8080")
 
-        with respx.mock:
+        with TestClient(app) as client, respx.mock:
             respx.get("http://torchserve:8080/ping").mock(
                 return_value=httpx.Response(200, json={"status": "Healthy"})
             )
@@ -265,10 +355,9 @@ class TestHealthEndpoints:
     @pytest.mark.asyncio
     async def test_readyz_unhealthy(self, monkeypatch):
         """Test readiness when TorchServe is down."""
-        client = TestClient(app)
         monkeypatch.setenv("TS_URL", "http://torchserve:8080")
 
-        with respx.mock:
+        with TestClient(app) as client, respx.mock:
             respx.get("http://torchserve:8080/ping").mock(
                 return_value=httpx.Response(503)
             )
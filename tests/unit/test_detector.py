@@ -1,6 +1,12 @@
 import numpy as np
+import pytest
 
-from config.reliability.drift.detector import cosine_distance, is_drifted_cosine
+from config.reliability.drift.detector import (
+    CosineDriftDetector,
+    cosine_distance,
+    is_drifted_cosine,
+    kl_divergence,
+)
 
 
 def test_cosine_distance_bounds():
@@ -13,3 +19,78 @@ def test_is_drifted_cosine():
     ref = [np.array([1.0, 0.0]) for _ in range(10)]
     cur = [np.array([0.0, 1.0]) for _ in range(10)]
     assert is_drifted_cosine(ref, cur, threshold=0.1) is True
+
+
+def test_is_drifted_cosine_matches_pairwise():
+    rng = np.random.default_rng(0)
+    ref = list(rng.normal(size=(50, 8)))
+    cur = list(rng.normal(size=(50, 8)))
+    p95 = float(np.percentile([cosine_distance(r, c) for r, c in zip(ref, cur)], 95))
+    assert is_drifted_cosine(ref, cur, threshold=p95 - 1e-6) is True
+    assert is_drifted_cosine(ref, cur, threshold=p95 + 1e-6) is False
+
+
+def test_cosine_distance_numpy_fallback(monkeypatch):
+    from config.reliability.drift import detector
+
+    a = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+    b = np.array([3.0, 2.0, 1.0], dtype=np.float32)
+    accelerated = detector.cosine_distance(a, b)
+    monkeypatch.setattr(detector, "simsimd", None)
+    assert abs(detector.cosine_distance(a, b) - accelerated) < 1e-5
+
+
+@pytest.mark.parametrize("backend", ["simsimd", "numpy"])
+def test_cosine_distance_zero_vectors(monkeypatch, backend):
+    from config.reliability.drift import detector
+
+    if backend == "simsimd":
+        pytest.importorskip("simsimd")
+    else:
+        monkeypatch.setattr(detector, "simsimd", None)
+    z = np.zeros(3, dtype=np.float32)
+    v = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+    assert detector.cosine_distance(z, z) == 1.0
+    assert detector.cosine_distance(z, v) == 1.0
+    assert detector.cosine_distance(v, z) == 1.0
+    # Same answer as the batched check
+    assert is_drifted_cosine([z], [z], threshold=0.99) is True
+
+
+def test_simd_compatible_checks_both_vectors():
+    from config.reliability.drift.detector import _simd_compatible
+
+    a = np.zeros(3, dtype=np.float32)
+    assert _simd_compatible(a, np.ones(3, dtype=np.float32))
+    assert not _simd_compatible(a, np.ones((1, 3), dtype=np.float32))
+    assert not _simd_compatible(a, np.ones(4, dtype=np.float32))
+    assert not _simd_compatible(a, np.ones(3, dtype=np.int32))
+
+
+def test_kl_divergence():
+    p = np.array([0.5, 0.5, 0.0])
+    q = np.array([0.25, 0.25, 0.5])
+    assert abs(kl_divergence(p, p)) < 1e-9
+    assert abs(kl_divergence(p, q) - np.log(2.0)) < 1e-9
+
+
+def test_kl_divergence_mixed_dtypes():
+    p = np.array([0.5, 0.5, 0.0], dtype=np.float32)
+    q = np.array([1, 1, 2])
+    assert abs(kl_divergence(p, q / 4) - np.log(2.0)) < 1e-6
+    assert abs(kl_divergence(np.array([1, 0]), np.array([1, 0]))) < 1e-9
+
+
+def test_cosine_drift_detector_streaming():
+    pytest.importorskip("ddsketch")
+    rng = np.random.default_rng(1)
+    ref = rng.normal(size=(500, 8))
+    cur = rng.normal(size=(500, 8))
+    det = CosineDriftDetector()
+    assert det.is_drifted(threshold=0.0) is False
+    for r, c in zip(ref, cur):
+        det.update(r, c)
+    assert det.count == 500
+    p95 = float(np.percentile([cosine_distance(r, c) for r, c in zip(ref, cur)], 95))
+    assert det.is_drifted(threshold=p95 * 0.95) is True
+    assert det.is_drifted(threshold=p95 * 1.05) is False
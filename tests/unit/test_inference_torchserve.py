@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 import respx
 from fastapi.testclient import TestClient
 
@@ -6,11 +9,10 @@ from services.inference.app.main import app
 
 
 def test_predict_calls_torchserve_success(monkeypatch):
-    client = TestClient(app)
     monkeypatch.setenv("TS_URL", "http://ts:8080")
     monkeypatch.setenv("MODEL_NAME", "custom-text")
 
-    with respx.mock(base_url="http://ts:8080") as mock:
+    with TestClient(app) as client, respx.mock(base_url="http://ts:8080") as mock:
         mock.post("/predictions/custom-text").respond(
             200,
             json={"prediction": "positive"},
@@ -23,15 +25,115 @@ def test_predict_calls_torchserve_success(monkeypatch):
 
 
 def test_predict_fallback_on_error(monkeypatch):
-    client = TestClient(app)
     monkeypatch.setenv("TS_URL", "http://ts:8080")
     monkeypatch.setenv("MODEL_NAME", "custom-text")
 
-    with respx.mock(base_url="http://ts:8080") as mock:
+    with TestClient(app) as client, respx.mock(base_url="http://ts:8080") as mock:
         mock.post("/predictions/custom-text").respond(500, text="boom")
         r = client.post(
             "/predict", json={"text": "abc"}
         )  # odd length -> negative fallback
         assert r.status_code == 200
         body = r.json()
-        assert body["prediction"] in ("negative", "positive")
+        assert body["prediction"] == "negative"
+
+
+def test_predict_plain_text_response(monkeypatch):
+    monkeypatch.setenv("TS_URL", "http://ts:8080")
+    monkeypatch.setenv("MODEL_NAME", "custom-text")
+
+    with TestClient(app) as client, respx.mock(base_url="http://ts:8080") as mock:
+        mock.post("/predictions/custom-text").respond(
+            200, content=b"  negative\n", headers={"content-type": "text/plain"}
+        )
+        r = client.post("/predict", json={"text": "abcd"})
+        assert r.status_code == 200
+        assert r.json()["prediction"] == "negative"
+
+
+def test_predict_async_job_lifecycle(monkeypatch):
+    monkeypatch.setenv("TS_URL", "http://ts:8080")
+    monkeypatch.setenv("MODEL_NAME", "custom-text")
+
+    with TestClient(app) as client, respx.mock(base_url="http://ts:8080") as mock:
+        mock.post("/predictions/custom-text").respond(
+            200,
+            json={"prediction": "positive"},
+            headers={"content-type": "application/json"},
+        )
+        r = client.post("/predict_async", json={"text": "abcd"})
+        assert r.status_code == 202
+        job_id = r.json()["job_id"]
+
+        for _ in range(50):
+            r = client.get(f"/predict_result/{job_id}")
+            if r.status_code == 200:
+                break
+            time.sleep(0.01)
+        assert r.status_code == 200
+        body = r.json()
+        assert body["status"] == "done"
+        assert body["result"]["prediction"] == "positive"
+
+        assert client.get("/predict_result/missing").status_code == 404
+
+
+def test_shutdown_waits_for_cancelled_jobs(monkeypatch):
+    monkeypatch.setenv("TS_URL", "http://ts:8080")
+    monkeypatch.setenv("MODEL_NAME", "custom-text")
+    started, client_closed_at_unwind = [], []
+
+    async def slow_backend(request):
+        started.append(True)
+        try:
+            await asyncio.sleep(10)
+        finally:
+            client_closed_at_unwind.append(app.state.http.is_closed)
+
+    # respx only records a call once it returns, which this one never does
+    mock = respx.mock(base_url="http://ts:8080", assert_all_called=False)
+    with TestClient(app) as client, mock:
+        mock.post("/predictions/custom-text").mock(side_effect=slow_backend)
+        assert client.post("/predict_async", json={"text": "abcd"}).status_code == 202
+        for _ in range(50):
+            if started:
+                break
+            time.sleep(0.01)
+        assert started
+    # The job unwound before the TorchServe client was closed
+    assert client_closed_at_unwind == [False]
+
+
+def test_predict_async_rejects_when_full(monkeypatch):
+    monkeypatch.setenv("TS_URL", "http://ts:8080")
+    monkeypatch.setenv("MODEL_NAME", "custom-text")
+    monkeypatch.setenv("ASYNC_MAX_INFLIGHT", "1")
+
+    async def slow_backend(request):
+        await asyncio.sleep(10)
+
+    mock = respx.mock(base_url="http://ts:8080", assert_all_called=False)
+    with TestClient(app) as client, mock:
+        mock.post("/predictions/custom-text").mock(side_effect=slow_backend)
+        assert client.post("/predict_async", json={"text": "abcd"}).status_code == 202
+        assert client.post("/predict_async", json={"text": "abcd"}).status_code == 503
+
+
+def test_predict_async_expires_finished_jobs(monkeypatch):
+    monkeypatch.setenv("TS_URL", "http://ts:8080")
+    monkeypatch.setenv("MODEL_NAME", "custom-text")
+    monkeypatch.setenv("ASYNC_JOB_TTL_S", "0")
+
+    with TestClient(app) as client, respx.mock(base_url="http://ts:8080") as mock:
+        mock.post("/predictions/custom-text").respond(
+            200,
+            json={"prediction": "positive"},
+            headers={"content-type": "application/json"},
+        )
+        job_id = client.post("/predict_async", json={"text": "abcd"}).json()["job_id"]
+        for _ in range(50):
+            if app.state.finished_jobs:
+                break
+            time.sleep(0.01)
+        assert client.get(f"/predict_result/{job_id}").status_code == 404
+        assert not app.state.jobs and not app.state.finished_jobs